@@ -296,6 +296,16 @@ class BaseAPIScraper(ABC):
             "estimated_cost": self.pricing.estimate_cost(self._total_tweets_fetched) if self.pricing else 0,
         }
     
+    def add_usage(self, stats: Dict[str, Any]):
+        """
+        Fold another client's get_usage_stats() into this one's totals.
+        
+        Args:
+            stats: Usage stats from a scraper that shared this session.
+        """
+        self._total_tweets_fetched += stats.get("total_tweets_fetched", 0)
+        self._total_api_calls += stats.get("total_api_calls", 0)
+    
     def reset_stats(self):
         """Reset usage statistics."""
         self._total_tweets_fetched = 0
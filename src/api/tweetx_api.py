@@ -7,7 +7,6 @@ Pricing: ~$0.14 per 1,000 tweets (pay-as-you-go)
 Documentation: https://twitterxapi.com/docs
 """
 
-import requests
 import time
 from typing import List, Dict, Optional, Callable
 from datetime import datetime, timedelta
@@ -77,6 +76,8 @@ class TweetXAPIScraper(BaseAPIScraper):
         if not self.api_key:
             raise APIAuthenticationError("API key is required")
         
+        import requests
+
         # Make a minimal test request
         try:
             endpoint = f"{self.BASE_URL}/twitter/advanced_search"
@@ -341,6 +342,8 @@ class TweetXAPIScraper(BaseAPIScraper):
             "sortBy": "Latest",
         }
         
+        import requests
+
         try:
             response = requests.post(
                 endpoint,
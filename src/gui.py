@@ -1,22 +1,19 @@
 import tkinter as tk
-from tkinter import messagebox, ttk, filedialog
+from tkinter import messagebox, ttk, filedialog, font as tkfont
 from tkinter.scrolledtext import ScrolledText
-from src.scraper import (
-    CookieExpiredError,
-    NetworkError,
-    EmptyPagePromptException,
-    scrape_tweets,
-    scrape_tweet_links_file,
-    authenticate,
-)
 import threading
 import asyncio
 from datetime import datetime
 import os
+import re
+import socket
 import sys
 import time as time_module
-from PIL import Image, ImageTk
-import webbrowser
+from pathlib import Path
+from types import MappingProxyType
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from src.state_manager import StateManager
 from src.create_cookie import convert_editthiscookie_to_twikit_format
 
@@ -73,67 +70,421 @@ except ImportError:
     API_MODULE_AVAILABLE = False
 
 
+# Keep only the most recent log lines so the Text widgets stay responsive
+MAX_LOG_LINES = 2000
+# Queued log lines are written to the widgets in batches by a one-shot
+# flush scheduled when the first line arrives; nothing runs while idle.
+LOG_FLUSH_MS = 50
+# While a log widget is hidden its lines are held and retried this often
+LOG_HIDDEN_RETRY_MS = 500
+LOG_FLUSH_BATCH = 200
+# How often the scraped-count label picks up the workers' latest count
+COUNT_TICK_MS = 200
+
+# Default number of users an API batch scrape fetches at once, used when
+# app settings don't set api_batch_concurrency. Stays at 1 until the
+# provider's rate limits are known.
+API_BATCH_CONCURRENCY = 1
+
+# Recovery saves journal only the fields that changed; a full state
+# snapshot is rewritten at most this often.
+STATE_CHECKPOINT_SECS = 60
+
+# File dialog filters never change at runtime
+USERNAME_FILETYPES = (("Text/CSV", "*.txt;*.csv"), ("All", "*.*"))
+LINKS_FILETYPES = (("Text", "*.txt"), ("Excel", "*.xlsx;*.xls"), ("All", "*.*"))
+
+# ttk style options that don't depend on the colour theme. Colour options
+# are applied by setup_styles, which re-runs on every theme toggle.
+STATIC_STYLES = {
+    "TNotebook": {"borderwidth": 0},
+    "TNotebook.Tab": {"padding": [20, 8], "font": ("Segoe UI", 9)},
+    "TEntry": {"padding": 6},
+    "TCombobox": {"padding": 4, "selectforeground": "white"},
+    "TCheckbutton": {"font": ("Segoe UI", 9)},
+    "TRadiobutton": {"font": ("Segoe UI", 9)},
+    "TSpinbox": {"padding": 4},
+    "TButton": {"padding": [10, 5], "font": ("Segoe UI", 9)},
+}
+
+# Colour-dependent ttk styles as (style, configure options, state map).
+# Upper-case values name a Colors attribute and are looked up on every
+# setup_styles call, so the table serves both themes.
+THEMED_STYLES = (
+    ("TNotebook", {"background": "BG"}, None),
+    (
+        "TNotebook.Tab",
+        {"background": "BG_SECONDARY", "foreground": "TEXT_SECONDARY"},
+        {"background": (("selected", "BG"),), "foreground": (("selected", "PRIMARY"),)},
+    ),
+    (
+        "TEntry",
+        {"fieldbackground": "BG_SECONDARY", "foreground": "TEXT", "insertcolor": "TEXT"},
+        {
+            "fieldbackground": (("focus", "BG_SECONDARY"), ("!focus", "BG_SECONDARY")),
+            "foreground": (("focus", "TEXT"), ("!focus", "TEXT")),
+        },
+    ),
+    (
+        "TCombobox",
+        {
+            "fieldbackground": "BG_SECONDARY",
+            "background": "BG_SECONDARY",
+            "foreground": "TEXT",
+            "arrowcolor": "TEXT",
+            "selectbackground": "PRIMARY",
+        },
+        {
+            "fieldbackground": (("readonly", "BG_SECONDARY"), ("focus", "BG_SECONDARY")),
+            "background": (("active", "BG_SECONDARY"), ("pressed", "BG_SECONDARY")),
+            "foreground": (("readonly", "TEXT"), ("focus", "TEXT")),
+            "arrowcolor": (("disabled", "TEXT_SECONDARY"),),
+            "selectbackground": (("focus", "PRIMARY"),),
+            "selectforeground": (("focus", "white"),),
+        },
+    ),
+    (
+        "TCheckbutton",
+        {"background": "BG", "foreground": "TEXT", "focuscolor": "BG"},
+        {
+            "background": (("active", "BG"), ("pressed", "BG")),
+            "foreground": (("active", "TEXT"), ("disabled", "TEXT_SECONDARY")),
+            "indicatorcolor": (("selected", "PRIMARY"), ("!selected", "BG_SECONDARY")),
+        },
+    ),
+    (
+        "TRadiobutton",
+        {"background": "BG", "foreground": "TEXT", "focuscolor": "BG"},
+        {
+            "background": (("active", "BG"), ("pressed", "BG")),
+            "foreground": (("active", "TEXT"),),
+        },
+    ),
+    (
+        "Blue.Horizontal.TProgressbar",
+        {"background": "PRIMARY", "troughcolor": "BORDER"},
+        None,
+    ),
+    (
+        "TSpinbox",
+        {
+            "fieldbackground": "BG_SECONDARY",
+            "background": "BG_SECONDARY",
+            "foreground": "TEXT",
+            "arrowcolor": "TEXT",
+            "insertcolor": "TEXT",
+        },
+        {
+            "fieldbackground": (("focus", "BG_SECONDARY"),),
+            "foreground": (("focus", "TEXT"),),
+            "arrowcolor": (("disabled", "TEXT_SECONDARY"),),
+        },
+    ),
+    (
+        "Vertical.TScrollbar",
+        {
+            "background": "BG_SECONDARY",
+            "troughcolor": "BG",
+            "arrowcolor": "TEXT_SECONDARY",
+            "bordercolor": "BORDER",
+        },
+        {"background": (("active", "BORDER"), ("pressed", "PRIMARY"))},
+    ),
+    ("TFrame", {"background": "BG"}, None),
+    ("TLabelframe", {"background": "BG", "foreground": "TEXT"}, None),
+    ("TLabelframe.Label", {"background": "BG", "foreground": "TEXT"}, None),
+    (
+        "TButton",
+        {"background": "BG_SECONDARY", "foreground": "TEXT"},
+        {
+            "background": (("active", "BORDER"), ("pressed", "PRIMARY")),
+            "foreground": (("active", "TEXT"), ("pressed", "white")),
+        },
+    ),
+    # Coloured variants; they inherit TButton's padding and font
+    (
+        "Primary.TButton",
+        {"background": "PRIMARY", "foreground": "white"},
+        {
+            "background": (("active", "PRIMARY_DARK"), ("pressed", "PRIMARY_DARK")),
+            "foreground": (("active", "white"), ("pressed", "white")),
+        },
+    ),
+    (
+        "Success.TButton",
+        {"background": "SUCCESS", "foreground": "white"},
+        {
+            "background": (("active", "#16a34a"), ("pressed", "#16a34a")),
+            "foreground": (("active", "white"), ("pressed", "white")),
+        },
+    ),
+)
+
+# Usernames in batch files may be separated by commas, newlines or spaces
+USERNAME_SPLIT_RE = re.compile(r"[\s,]+")
+
+# Time entries are validated on every focus change; seconds are optional
+# and, as with strptime, each field may drop its leading zero
+TIME_RE = re.compile(r"^([01]?\d|2[0-3]):[0-5]?\d(:[0-5]?\d)?$")
+
+# Host the recovery dialog connects to when testing the network
+CONNECTIVITY_PROBE = ("x.com", 443)
+
+# Video walkthroughs linked from the guide and cookie dialog
+SETUP_VIDEO_URL = "https://youtu.be/RKX2sgQVgBg"
+TUTORIAL_VIDEO_URL = "https://youtu.be/AbdpX6QZLm4"
+
+# Banner at the top of the plain-text documentation export
+DOC_TEXT_HEADER = (
+    f"{'=' * 70}\n"
+    "CHI TWEET SCRAPER - COMPLETE USER DOCUMENTATION\n"
+    "Version 1.2.0\n"
+    f"{'=' * 70}\n\n"
+)
+
+# Guide contact row: (label, URL, brand colour, active colour)
+CONTACT_LINKS = (
+    ("💬 WhatsApp", "https://wa.me/2348088666352", "#25D366", "#128C7E"),
+    ("🐦 Twitter", "https://twitter.com/datacreatorhub", "#1DA1F2", "#0c85d0"),
+    ("🐙 GitHub", "https://github.com/OJTheCreator", "#333333", "#24292e"),
+)
+
+
+# Bundled files live under PyInstaller's extraction dir when frozen,
+# otherwise under the project root
+BASE_PATH = getattr(sys, "_MEIPASS", None) or os.path.abspath(
+    os.path.join(os.path.dirname(__file__), "..")
+)
+
+
+@lru_cache(maxsize=None)
 def resource_path(relative_path):
+    return os.path.join(BASE_PATH, relative_path)
+
+
+def open_url(url, _event=None):
+    """Open ``url`` in the browser; usable directly as a Tk event callback."""
+    import webbrowser
+
+    webbrowser.open(url)
+
+
+def center_window(window, width, height):
+    """Size ``window`` and center it on screen with a single geometry call."""
+    x = (window.winfo_screenwidth() - width) // 2
+    y = (window.winfo_screenheight() - height) // 2
+    window.geometry(f"{width}x{height}+{x}+{y}")
+
+
+def parse_date(value):
+    """Parse a ``YYYY-MM-DD`` string, returning ``None`` if it isn't one.
+
+    Month and day may drop their leading zero, as strptime allowed.
+    """
+    parts = value.split("-")
+    if len(parts) != 3 or not all(p.isdigit() for p in parts):
+        return None
     try:
-        base_path = sys._MEIPASS
-    except AttributeError:
-        base_path = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
-    return os.path.join(base_path, relative_path)
+        return datetime(*map(int, parts))
+    except ValueError:
+        return None
+
+
+def parse_time(value):
+    """Parse ``H:MM`` or ``H:MM:SS`` into (hour, minute, second), or ``None``."""
+    parts = value.split(":")
+    if len(parts) not in (2, 3) or not all(
+        p.isdigit() and len(p) <= 2 for p in parts
+    ):
+        return None
+    hour, minute, second = (*map(int, parts), 0)[:3]
+    if hour > 23 or minute > 59 or second > 59:
+        return None
+    return hour, minute, second
+
+
+def combine_date_time(date_value, time_value):
+    """Join a ``YYYY-MM-DD`` date and an ``H:MM[:SS]`` time, or ``None``."""
+    day = parse_date(date_value)
+    hms = parse_time(time_value)
+    if day is None or hms is None:
+        return None
+    return day.replace(hour=hms[0], minute=hms[1], second=hms[2])
+
+
+# Scraper names are bound by load_scraper() on first use; importing
+# src.scraper pulls in twikit, pandas and openpyxl, which slows startup
+CookieExpiredError = NetworkError = None
+LINK_FILE_EXTENSIONS = load_links_file = None
+scrape_tweets = scrape_tweet_links_file = None
+
+
+def load_scraper():
+    """Import the cookie scraper stack on first use."""
+    global CookieExpiredError, NetworkError, LINK_FILE_EXTENSIONS
+    global load_links_file, scrape_tweets, scrape_tweet_links_file
+    from src.scraper import (
+        CookieExpiredError,
+        NetworkError,
+        LINK_FILE_EXTENSIONS,
+        load_links_file,
+        scrape_tweets,
+        scrape_tweet_links_file,
+    )
+
+
+# Resized logo images keyed by (path, width, height); each entry also keeps
+# the Tcl interpreter its image was created in
+LOGO_CACHE = {}
+
+
+def load_logo(path, size, master):
+    """Return ``path`` as a PhotoImage at ``size``, resizing with PIL only once.
+
+    A cached image is only reused under the interpreter that created it,
+    since a new Tk root cannot display images from a destroyed one.
+    """
+    key = (path, *size)
+    cached = LOGO_CACHE.get(key)
+    if cached is not None and cached[0] is master.tk:
+        return cached[1]
+    from PIL import Image, ImageTk
+
+    img = Image.open(path).resize(size, Image.LANCZOS)
+    photo = ImageTk.PhotoImage(img, master=master)
+    LOGO_CACHE[key] = (master.tk, photo)
+    return photo
+
+
+@lru_cache(maxsize=None)
+def date_preset_names():
+    """Combobox labels for the date presets; the names never change."""
+    return ("Custom", *(name for name, _start, _end in get_date_presets()))
+
+
+COOKIES_DIR = resource_path("cookies")
+EXPORTS_DIR = resource_path(os.path.join("data", "exports"))
+
+
+def _existing_asset(name):
+    """Resolve ``assets/<name>``, or None if it isn't shipped."""
+    path = resource_path(os.path.join("assets", name))
+    return path if os.path.exists(path) else None
+
+
+# Bundled images, resolved and checked once at import
+LOGO_ICO_PATH = _existing_asset("logo.ico")
+LOGO_PNG_PATH = _existing_asset("logo.png")
+
+
+@lru_cache(maxsize=1)
+def load_guide_text():
+    """Read the bundled user guide once and reuse it for every open."""
+    try:
+        with open(
+            resource_path(os.path.join("assets", "user_guide.txt")), encoding="utf-8"
+        ) as f:
+            return f.read()
+    except OSError:
+        return "User guide not found. Use 'Download Full Docs' below.\n"
 
 
 # ========================================
 # THEME SYSTEM (Light/Dark Mode)
 # ========================================
+# Read-only palettes; set_dark_mode copies one onto Colors
+LIGHT_PALETTE = MappingProxyType({
+    "PRIMARY": "#2563eb",
+    "PRIMARY_DARK": "#1d4ed8",
+    "PRIMARY_LIGHT": "#3b82f6",
+    "BG": "#ffffff",
+    "BG_SECONDARY": "#f8fafc",
+    "BORDER": "#e2e8f0",
+    "TEXT": "#1e293b",
+    "TEXT_SECONDARY": "#64748b",
+    "SUCCESS": "#22c55e",
+    "ERROR": "#ef4444",
+    "WARNING": "#f59e0b",
+})
+
+DARK_PALETTE = MappingProxyType({
+    "PRIMARY": "#3b82f6",
+    "PRIMARY_DARK": "#2563eb",
+    "PRIMARY_LIGHT": "#60a5fa",
+    "BG": "#1e1e2e",
+    "BG_SECONDARY": "#2a2a3c",
+    "BORDER": "#404052",
+    "TEXT": "#e2e8f0",
+    "TEXT_SECONDARY": "#a1a1b5",
+    "SUCCESS": "#4ade80",
+    "ERROR": "#f87171",
+    "WARNING": "#fbbf24",
+})
+
+# Colours _update_widget_colors recognises when re-theming existing widgets
+PRIMARY_SHADES = frozenset(("#2563eb", "#3b82f6", "#1d4ed8"))
+SUCCESS_SHADES = frozenset(("#22c55e", "#4ade80", "#16a34a"))
+ERROR_SHADES = frozenset(("#ef4444", "#f87171", "#dc2626"))
+SECONDARY_TEXT_SHADES = frozenset(
+    (LIGHT_PALETTE["TEXT_SECONDARY"], DARK_PALETTE["TEXT_SECONDARY"])
+)
+
+
 class Colors:
     """Color theme with dark mode support."""
     _dark_mode = False
     
     # Light theme (default)
-    PRIMARY = "#2563eb"
-    PRIMARY_DARK = "#1d4ed8"
-    PRIMARY_LIGHT = "#3b82f6"
-    BG = "#ffffff"
-    BG_SECONDARY = "#f8fafc"
-    BORDER = "#e2e8f0"
-    TEXT = "#1e293b"
-    TEXT_SECONDARY = "#64748b"
-    SUCCESS = "#22c55e"
-    ERROR = "#ef4444"
-    WARNING = "#f59e0b"
+    PRIMARY = LIGHT_PALETTE["PRIMARY"]
+    PRIMARY_DARK = LIGHT_PALETTE["PRIMARY_DARK"]
+    PRIMARY_LIGHT = LIGHT_PALETTE["PRIMARY_LIGHT"]
+    BG = LIGHT_PALETTE["BG"]
+    BG_SECONDARY = LIGHT_PALETTE["BG_SECONDARY"]
+    BORDER = LIGHT_PALETTE["BORDER"]
+    TEXT = LIGHT_PALETTE["TEXT"]
+    TEXT_SECONDARY = LIGHT_PALETTE["TEXT_SECONDARY"]
+    SUCCESS = LIGHT_PALETTE["SUCCESS"]
+    ERROR = LIGHT_PALETTE["ERROR"]
+    WARNING = LIGHT_PALETTE["WARNING"]
     
     @classmethod
     def set_dark_mode(cls, enabled: bool):
         cls._dark_mode = enabled
-        if enabled:
-            cls.PRIMARY = "#3b82f6"
-            cls.PRIMARY_DARK = "#2563eb"
-            cls.PRIMARY_LIGHT = "#60a5fa"
-            cls.BG = "#1e1e2e"
-            cls.BG_SECONDARY = "#2a2a3c"
-            cls.BORDER = "#404052"
-            cls.TEXT = "#e2e8f0"
-            cls.TEXT_SECONDARY = "#a1a1b5"
-            cls.SUCCESS = "#4ade80"
-            cls.ERROR = "#f87171"
-            cls.WARNING = "#fbbf24"
-        else:
-            cls.PRIMARY = "#2563eb"
-            cls.PRIMARY_DARK = "#1d4ed8"
-            cls.PRIMARY_LIGHT = "#3b82f6"
-            cls.BG = "#ffffff"
-            cls.BG_SECONDARY = "#f8fafc"
-            cls.BORDER = "#e2e8f0"
-            cls.TEXT = "#1e293b"
-            cls.TEXT_SECONDARY = "#64748b"
-            cls.SUCCESS = "#22c55e"
-            cls.ERROR = "#ef4444"
-            cls.WARNING = "#f59e0b"
+        for name, value in (DARK_PALETTE if enabled else LIGHT_PALETTE).items():
+            setattr(cls, name, value)
     
     @classmethod
     def is_dark_mode(cls):
         return cls._dark_mode
 
 
+def _resolve_colors(value, palette):
+    """Map Colors attribute names in a THEMED_STYLES entry via ``palette``."""
+    if isinstance(value, dict):
+        return {opt: palette.get(v, v) for opt, v in value.items()}
+    return palette.get(value, value)
+
+
+# Buttons from _create_button carry this bind tag; one pair of class
+# bindings gives all of them their hover colour
+HOVER_BINDTAG = "ChiHoverBtn"
+
+
+def _hover_enter(event):
+    """Swap a button to its active colour, remembering the current one."""
+    widget = event.widget
+    widget._base_bg = widget.cget("bg")
+    widget.config(bg=widget.cget("activebackground"))
+
+
+def _hover_leave(event):
+    """Restore the colour saved by _hover_enter."""
+    widget = event.widget
+    base_bg = getattr(widget, "_base_bg", None)
+    if base_bg is not None:
+        widget.config(bg=base_bg)
+
+
 class TweetScraperApp:
     def __init__(self, root):
         self.root = root
@@ -151,13 +502,9 @@ class TweetScraperApp:
         root.minsize(800, 800)
         root.configure(bg=Colors.BG)
 
-        # Set window icon
-        try:
-            icon_path = resource_path(os.path.join("assets", "logo.ico"))
-            if os.path.exists(icon_path):
-                root.iconbitmap(icon_path)
-        except:
-            pass
+        # Set window icon; dialogs reuse the same path
+        self._icon_path = LOGO_ICO_PATH
+        self._set_window_icon(root)
 
         self.state_manager = StateManager()
         self.paused_for_cookies = False
@@ -165,10 +512,23 @@ class TweetScraperApp:
         self.paused_for_error = False
         self.user_action = None
         # FIX: Track cancellation explicitly instead of relying on task.done()
-        self._stop_requested = False
+        self._stop_evt = threading.Event()
         self._is_running = False
         # FIX: Track current scrape state for better resume
         self.current_scrape_state = {}
+        self._state_saved_at = 0.0
+        # Log lines from any thread; written to the widgets by _flush_logs
+        self._log_q = deque()
+        # Lines drained from _log_q but not yet written, per widget
+        self._held_logs = {
+            "log_text": deque(maxlen=MAX_LOG_LINES),
+            "links_log_text": deque(maxlen=MAX_LOG_LINES),
+        }
+        self._log_flush_scheduled = False
+        self._ts_cache = (0, "")
+        # Latest scraped count from the workers; _tick_count_label renders it
+        self._latest_count = None
+        self._shown_count = None
         
         # API Mode tracking
         self.api_scraper = None  # Current API scraper instance
@@ -194,167 +554,89 @@ class TweetScraperApp:
         root.rowconfigure(0, weight=1)
 
         self.task = None
-        self.loop = None
+        # Recovery dialog is built on first use and reused afterwards
+        self._rec_dialog = None
+        self._rec_dark = None
+        self._rec_error_type = None
+        self._rec_on_close = None
+        # User guide window, kept hidden between opens
+        self._guide_window = None
+        self._guide_dark = None
+        # Set while a theme pass is queued; rapid toggles share one pass
+        self._theme_pending = False
+        # One long-lived event loop runs scrape coroutines off the Tk thread
+        self._aio_loop = asyncio.new_event_loop()
+        threading.Thread(target=self._aio_loop.run_forever, daemon=True).start()
         self.current_task_type = None
         self.file_path = None
         self.links_file_path = None
         self.save_dir = tk.StringVar(
-            value=os.path.join(os.path.dirname(__file__), "..", "data", "exports")
+            value=os.path.abspath(
+                os.path.join(os.path.dirname(__file__), "..", "data", "exports")
+            )
         )
 
+        # Shared named fonts for dialogs, so each widget doesn't get its own
+        self._font_ui = tkfont.Font(root=root, family="Segoe UI", size=9)
+        self._font_title = tkfont.Font(
+            root=root, family="Segoe UI", size=14, weight="bold"
+        )
+        self.style = ttk.Style(root)
+        self._static_styles_applied = False
         self.setup_styles()
+        root.bind_class(HOVER_BINDTAG, "<Enter>", _hover_enter)
+        root.bind_class(HOVER_BINDTAG, "<Leave>", _hover_leave)
         self.create_ui()
+        self.root.after(COUNT_TICK_MS, self._tick_count_label)
         self.root.after(500, self.check_for_saved_state)
         self.root.after(600, self._load_last_settings)  # Load settings after UI is built
 
+    def _set_window_icon(self, window):
+        if self._icon_path:
+            try:
+                window.iconbitmap(self._icon_path)
+            except tk.TclError:
+                pass  # .ico isn't supported by every platform's Tk
+
     def _should_stop(self) -> bool:
         """
         FIX: Unambiguous stop check.
         Only returns True if user explicitly requested stop.
         Does NOT check task.done() which was ambiguous.
         """
-        return self._stop_requested
+        return self._stop_evt.is_set()
 
     def setup_styles(self):
-        style = ttk.Style()
-        try:
-            style.theme_use("clam")
-        except:
-            pass
+        style = self.style
+        # setup_styles re-runs on every theme toggle; only switch once
+        if style.theme_use() != "clam":
+            try:
+                style.theme_use("clam")
+            except tk.TclError:
+                pass
 
-        style.configure("TNotebook", background=Colors.BG, borderwidth=0)
-        style.configure(
-            "TNotebook.Tab",
-            background=Colors.BG_SECONDARY,
-            foreground=Colors.TEXT_SECONDARY,
-            padding=[20, 8],
-            font=("Segoe UI", 9),
-        )
-        style.map(
-            "TNotebook.Tab",
-            background=[("selected", Colors.BG)],
-            foreground=[("selected", Colors.PRIMARY)],
-        )
-        
-        # Entry styling
-        style.configure(
-            "TEntry", 
-            padding=6,
-            fieldbackground=Colors.BG_SECONDARY,
-            foreground=Colors.TEXT,
-            insertcolor=Colors.TEXT,
-        )
-        style.map(
-            "TEntry",
-            fieldbackground=[("focus", Colors.BG_SECONDARY), ("!focus", Colors.BG_SECONDARY)],
-            foreground=[("focus", Colors.TEXT), ("!focus", Colors.TEXT)],
-        )
-        
-        # Combobox styling
-        style.configure(
-            "TCombobox", 
-            padding=4,
-            fieldbackground=Colors.BG_SECONDARY,
-            background=Colors.BG_SECONDARY,
-            foreground=Colors.TEXT,
-            arrowcolor=Colors.TEXT,
-            selectbackground=Colors.PRIMARY,
-            selectforeground="white",
-        )
-        style.map(
-            "TCombobox",
-            fieldbackground=[("readonly", Colors.BG_SECONDARY), ("focus", Colors.BG_SECONDARY)],
-            background=[("active", Colors.BG_SECONDARY), ("pressed", Colors.BG_SECONDARY)],
-            foreground=[("readonly", Colors.TEXT), ("focus", Colors.TEXT)],
-            arrowcolor=[("disabled", Colors.TEXT_SECONDARY)],
-            selectbackground=[("focus", Colors.PRIMARY)],
-            selectforeground=[("focus", "white")],
-        )
-        
-        # Checkbutton styling
-        style.configure(
-            "TCheckbutton",
-            background=Colors.BG,
-            foreground=Colors.TEXT,
-            font=("Segoe UI", 9),
-            focuscolor=Colors.BG,
-        )
-        style.map(
-            "TCheckbutton",
-            background=[("active", Colors.BG), ("pressed", Colors.BG)],
-            foreground=[("active", Colors.TEXT), ("disabled", Colors.TEXT_SECONDARY)],
-            indicatorcolor=[("selected", Colors.PRIMARY), ("!selected", Colors.BG_SECONDARY)],
-        )
-        
-        # Radiobutton styling
-        style.configure(
-            "TRadiobutton",
-            background=Colors.BG,
-            foreground=Colors.TEXT,
-            font=("Segoe UI", 9),
-            focuscolor=Colors.BG,
-        )
-        style.map(
-            "TRadiobutton",
-            background=[("active", Colors.BG), ("pressed", Colors.BG)],
-            foreground=[("active", Colors.TEXT)],
-        )
-        
-        # Progress bar
-        style.configure(
-            "Blue.Horizontal.TProgressbar",
-            background=Colors.PRIMARY,
-            troughcolor=Colors.BORDER,
-        )
-        
-        # Spinbox styling
-        style.configure(
-            "TSpinbox", 
-            padding=4,
-            fieldbackground=Colors.BG_SECONDARY,
-            background=Colors.BG_SECONDARY,
-            foreground=Colors.TEXT,
-            arrowcolor=Colors.TEXT,
-            insertcolor=Colors.TEXT,
-        )
-        style.map(
-            "TSpinbox",
-            fieldbackground=[("focus", Colors.BG_SECONDARY)],
-            foreground=[("focus", Colors.TEXT)],
-            arrowcolor=[("disabled", Colors.TEXT_SECONDARY)],
-        )
-        
-        # Scrollbar styling
-        style.configure(
-            "Vertical.TScrollbar",
-            background=Colors.BG_SECONDARY,
-            troughcolor=Colors.BG,
-            arrowcolor=Colors.TEXT_SECONDARY,
-            bordercolor=Colors.BORDER,
-        )
-        style.map(
-            "Vertical.TScrollbar",
-            background=[("active", Colors.BORDER), ("pressed", Colors.PRIMARY)],
-        )
-        
-        # Frame styling
-        style.configure("TFrame", background=Colors.BG)
-        style.configure("TLabelframe", background=Colors.BG, foreground=Colors.TEXT)
-        style.configure("TLabelframe.Label", background=Colors.BG, foreground=Colors.TEXT)
-        
-        # Button styling (for ttk buttons if used)
-        style.configure(
-            "TButton",
-            background=Colors.BG_SECONDARY,
-            foreground=Colors.TEXT,
-            padding=[10, 5],
-            font=("Segoe UI", 9),
-        )
-        style.map(
-            "TButton",
-            background=[("active", Colors.BORDER), ("pressed", Colors.PRIMARY)],
-            foreground=[("active", Colors.TEXT), ("pressed", "white")],
-        )
+        # Theme-independent options only need to be set once per Style
+        if not self._static_styles_applied:
+            for name, opts in STATIC_STYLES.items():
+                style.configure(name, **opts)
+            self._static_styles_applied = True
+
+        # Colour options come from THEMED_STYLES, resolved against a
+        # snapshot of the current palette taken once per call
+        palette = {name: getattr(Colors, name) for name in LIGHT_PALETTE}
+        for name, options, state_map in THEMED_STYLES:
+            style.configure(name, **_resolve_colors(options, palette))
+            if state_map:
+                style.map(
+                    name,
+                    **{
+                        opt: [
+                            (state, _resolve_colors(value, palette))
+                            for state, value in spec
+                        ]
+                        for opt, spec in state_map.items()
+                    },
+                )
 
     def _create_button(self, parent, text, command, style="secondary", **kwargs):
         """Create a properly themed button.
@@ -412,19 +694,14 @@ class TweetScraperApp:
             pady=kwargs.get("pady", 6),
             width=kwargs.get("width", None),
         )
-        
-        # Add hover effect
-        def on_enter(e):
-            btn.config(bg=s["activebackground"])
-        def on_leave(e):
-            btn.config(bg=s["bg"])
-        
-        btn.bind("<Enter>", on_enter)
-        btn.bind("<Leave>", on_leave)
+        # Hover effect comes from the shared HOVER_BINDTAG class bindings
+        btn.bindtags((HOVER_BINDTAG,) + btn.bindtags())
         
         return btn
 
     def create_ui(self):
+        # Build the whole tree unmapped and show it after one layout pass
+        self.root.withdraw()
         main = tk.Frame(self.root, bg=Colors.BG, padx=20, pady=15)
         main.grid(row=0, column=0, sticky="nsew")
         main.columnconfigure(0, weight=1)
@@ -448,44 +725,49 @@ class TweetScraperApp:
         self.links_tab.rowconfigure(4, weight=1)
 
         self.create_main_tab()
-        self.create_links_tab()
+        # The links tab is built the first time it is shown
+        self._links_built = False
+        self._tab_changed_bind = self.notebook.bind(
+            "<<NotebookTabChanged>>", self._on_tab_changed
+        )
+        self.root.update_idletasks()
+        self.root.deiconify()
+
+    def _on_tab_changed(self, _event=None):
+        if self.notebook.index("current") == 1:
+            self._ensure_links_tab()
+
+    def _ensure_links_tab(self):
+        if not self._links_built:
+            self._links_built = True
+            # Tab switches need no handler once the tab exists
+            self.notebook.unbind("<<NotebookTabChanged>>", self._tab_changed_bind)
+            self.create_links_tab()
 
     def create_header(self, parent):
         header = tk.Frame(parent, bg=Colors.BG)
         header.grid(row=0, column=0, sticky="ew")
         header.columnconfigure(1, weight=1)
 
-        logo_frame = tk.Frame(header, bg=Colors.PRIMARY, width=40, height=40)
-        logo_frame.grid(row=0, column=0, padx=(0, 12))
-        logo_frame.grid_propagate(False)
+        # A single canvas draws the logo; no inner Label or .place() layout
+        logo = tk.Canvas(
+            header, width=40, height=40, bg=Colors.PRIMARY, highlightthickness=0
+        )
+        logo.grid(row=0, column=0, padx=(0, 12))
 
         # Load logo image with fallback
         self.logo_photo = None
         try:
-            logo_path = resource_path(os.path.join("assets", "logo.png"))
-            if os.path.exists(logo_path):
-                logo_img = Image.open(logo_path)
-                logo_img = logo_img.resize((32, 32), Image.LANCZOS)
-                self.logo_photo = ImageTk.PhotoImage(logo_img)
-                tk.Label(logo_frame, image=self.logo_photo, bg=Colors.PRIMARY).place(
-                    relx=0.5, rely=0.5, anchor="center"
-                )
-            else:
-                tk.Label(
-                    logo_frame,
-                    text="CT",
-                    font=("Segoe UI", 12, "bold"),
-                    bg=Colors.PRIMARY,
-                    fg="white",
-                ).place(relx=0.5, rely=0.5, anchor="center")
+            if LOGO_PNG_PATH:
+                self.logo_photo = load_logo(LOGO_PNG_PATH, (32, 32), self.root)
         except Exception:
-            tk.Label(
-                logo_frame,
-                text="CT",
-                font=("Segoe UI", 12, "bold"),
-                bg=Colors.PRIMARY,
-                fg="white",
-            ).place(relx=0.5, rely=0.5, anchor="center")
+            self.logo_photo = None
+        if self.logo_photo:
+            logo.create_image(20, 20, image=self.logo_photo)
+        else:
+            logo.create_text(
+                20, 20, text="CT", font=("Segoe UI", 12, "bold"), fill="white"
+            )
 
         title_frame = tk.Frame(header, bg=Colors.BG)
         title_frame.grid(row=0, column=1, sticky="w")
@@ -605,8 +887,9 @@ class TweetScraperApp:
 
         # Build scraping method options
         self.method_options = self._build_scraping_method_options()
-        self.method_display_map = {opt[0]: opt[1] for opt in self.method_options}
-        method_values = [opt[0] for opt in self.method_options]
+        # (display, value) pairs: the dict maps them, zip takes the labels
+        self.method_display_map = dict(self.method_options)
+        method_values = list(next(zip(*self.method_options)))
         
         self.method_var = tk.StringVar(value=method_values[0])
         self.method_combo = ttk.Combobox(
@@ -688,10 +971,6 @@ class TweetScraperApp:
         folder_btn.pack(side="right")
         
         # Save directory (takes remaining space)
-        # Check if save_dir has a value, if not show placeholder
-        if not self.save_dir.get() or not os.path.exists(self.save_dir.get()):
-            self.save_dir.set("")
-        
         self.save_dir_entry = ttk.Entry(export_frame, textvariable=self.save_dir, state="readonly")
         self.save_dir_entry.pack(side="left", fill="x", expand=True, padx=(0, 5))
         
@@ -730,6 +1009,7 @@ class TweetScraperApp:
             padx=6,
         )
         self.file_btn.pack(side="left", padx=(8, 0))
+        self._batch_widgets_on = False
 
         # Separator
         tk.Frame(row2, bg=Colors.BORDER, width=1).pack(side="left", fill="y", padx=15, pady=2)
@@ -746,16 +1026,15 @@ class TweetScraperApp:
             command=self.toggle_break_settings,
         ).pack(side="left")
 
-        self.tweet_interval_var = tk.StringVar(value="100")
         self.tweet_interval_spin = ttk.Spinbox(
             break_frame,
             from_=50,
             to=500,
             increment=50,
-            textvariable=self.tweet_interval_var,
             width=4,
-            state="disabled",
         )
+        self.tweet_interval_spin.set("100")
+        self.tweet_interval_spin.config(state="disabled")
         self.tweet_interval_spin.pack(side="left", padx=(4, 2))
 
         tk.Label(
@@ -766,15 +1045,14 @@ class TweetScraperApp:
             fg=Colors.TEXT,
         ).pack(side="left")
 
-        self.min_break_var = tk.StringVar(value="5")
         self.min_break_spin = ttk.Spinbox(
             break_frame,
             from_=1,
             to=30,
-            textvariable=self.min_break_var,
             width=3,
-            state="disabled",
         )
+        self.min_break_spin.set("5")
+        self.min_break_spin.config(state="disabled")
         self.min_break_spin.pack(side="left", padx=(4, 1))
 
         tk.Label(
@@ -785,16 +1063,18 @@ class TweetScraperApp:
             fg=Colors.TEXT,
         ).pack(side="left")
 
-        self.max_break_var = tk.StringVar(value="10")
         self.max_break_spin = ttk.Spinbox(
             break_frame,
             from_=1,
             to=30,
-            textvariable=self.max_break_var,
             width=3,
-            state="disabled",
         )
+        self.max_break_spin.set("10")
+        self.max_break_spin.config(state="disabled")
         self.max_break_spin.pack(side="left", padx=(1, 2))
+        self._break_spins_state = "disabled"
+        # (raw spinbox values, parsed settings) from get_break_settings
+        self._break_cache = (None, None)
 
         tk.Label(
             break_frame,
@@ -829,6 +1109,7 @@ class TweetScraperApp:
             width=12,
         )
         self.mode_menu.pack(side="left")
+        self._shown_mode = None
         self.mode_menu.bind("<<ComboboxSelected>>", self.update_mode)
 
         self.input_label = tk.Label(
@@ -867,7 +1148,7 @@ class TweetScraperApp:
         # Date preset dropdown
         if FEATURES_AVAILABLE:
             self.date_preset_var = tk.StringVar(value="Custom")
-            preset_options = ["Custom"] + [p[0] for p in get_date_presets()]
+            preset_options = date_preset_names()
             preset_combo = ttk.Combobox(
                 date_frame,
                 textvariable=self.date_preset_var,
@@ -917,6 +1198,8 @@ class TweetScraperApp:
             "<FocusIn>", lambda e: self._on_time_focus_in(e, "23:59:59")
         )
         self.end_time_entry.bind("<FocusOut>", lambda e: self._validate_time_entry(e))
+        # Time entries currently showing their grey default
+        self._time_placeholders = {self.start_time_entry, self.end_time_entry}
 
         # Row 3: Filters and format hint
         row3 = tk.Frame(inner, bg=Colors.BG)
@@ -1028,9 +1311,10 @@ class TweetScraperApp:
         control_row.grid(row=0, column=0, sticky="ew")
         control_row.columnconfigure(0, weight=1)
 
+        self.count_var = tk.StringVar(value="Ready")
         self.count_lbl = tk.Label(
             control_row,
-            text="Ready",
+            textvariable=self.count_var,
             font=("Segoe UI", 9),
             bg=Colors.BG,
             fg=Colors.TEXT_SECONDARY,
@@ -1076,6 +1360,15 @@ class TweetScraperApp:
         self.progress.grid(row=1, column=0, sticky="ew", pady=(8, 0))
         self.progress.grid_remove()
 
+    def _show_progress(self):
+        self.progress.grid()
+        self.progress.start(30)
+
+    def _hide_progress(self):
+        """Stop the animation as well, so a hidden bar doesn't keep redrawing."""
+        self.progress.stop()
+        self.progress.grid_remove()
+
     def create_log(self, parent):
         log_inner = tk.Frame(parent, bg=Colors.BG)
         log_inner.pack(fill="both", expand=True, padx=1, pady=1)
@@ -1091,6 +1384,8 @@ class TweetScraperApp:
             wrap=tk.WORD,
             height=10,
             insertbackground=Colors.TEXT,
+            undo=False,
+            maxundo=0,
         )
         self.log_text.grid(row=0, column=0, sticky="nsew")
 
@@ -1173,6 +1468,8 @@ class TweetScraperApp:
             wrap=tk.WORD,
             height=10,
             insertbackground=Colors.TEXT,
+            undo=False,
+            maxundo=0,
         )
         self.links_log_text.grid(row=0, column=0, sticky="nsew")
 
@@ -1190,265 +1487,351 @@ class TweetScraperApp:
     def _save_current_state_for_recovery(self, context):
         """Save current state when error occurs so progress isn't lost."""
         try:
-            state = self.current_scrape_state.copy()
-            state.update(context)
-            self.state_manager.save_state(state)
+            state = self.current_scrape_state
+            now = time_module.monotonic()
+            if not state or now - self._state_saved_at >= STATE_CHECKPOINT_SECS:
+                state.update(context)
+                # Write any debounced snapshot first so it can't land later
+                self.state_manager.flush_pending_state()
+                self.state_manager.save_state(state)
+                self._state_saved_at = now
+            else:
+                for key, value in context.items():
+                    if state.get(key) != value:
+                        state[key] = value
+                        self.state_manager.journal_append(key, value)
             self.log("💾 State saved for recovery")
         except Exception as e:
             self.log(f"⚠️ Could not save recovery state: {e}")
 
-    def _show_error_recovery_dialog(self, error_type, error_msg, context=None):
+    def _show_error_recovery_dialog(self, error_type, error_msg, context, on_close):
+        """Show the recovery dialog without waiting for it.
+
+        ``on_close(action)`` is invoked on the Tk thread with the user's
+        choice ("resume", "retry" or "stop") once the dialog closes.
+        """
         context = context or {}
         tweets_so_far = context.get("tweets_scraped", "Unknown")
         self._save_current_state_for_recovery(context)
         self.user_action = None
-        dialog_closed = threading.Event()
 
         def show_dialog():
-            dialog = tk.Toplevel(self.root)
-            dialog.title("Action Required")
-            dialog.geometry("500x400")
-            dialog.resizable(False, False)
-            dialog.transient(self.root)
+            # The dialog is built once and re-shown; rebuild it only if it
+            # was destroyed or the colour theme changed since
+            if (
+                self._rec_dialog is None
+                or not self._rec_dialog.winfo_exists()
+                or self._rec_dark != Colors.is_dark_mode()
+            ):
+                if self._rec_dialog is not None and self._rec_dialog.winfo_exists():
+                    self._rec_dialog.destroy()
+                self._build_recovery_dialog()
+            self._rec_on_close = on_close
+            self._populate_recovery_dialog(error_type, error_msg, tweets_so_far)
+
+            dialog = self._rec_dialog
+            dialog.deiconify()
             dialog.grab_set()
-            dialog.configure(bg=Colors.BG)
-            dialog.protocol("WM_DELETE_WINDOW", lambda: None)
+            dialog.focus_force()
+            if error_type == "cookie":
+                self._rec_cookie_text.focus()
 
-            try:
-                icon_path = resource_path(os.path.join("assets", "logo.ico"))
-                if os.path.exists(icon_path):
-                    dialog.iconbitmap(icon_path)
-            except:
-                pass
+        self.root.after(0, show_dialog)
 
-            dialog.update_idletasks()
-            x = (dialog.winfo_screenwidth() // 2) - 250
-            y = (dialog.winfo_screenheight() // 2) - 200
-            dialog.geometry(f"500x400+{x}+{y}")
+    def _build_recovery_dialog(self):
+        """Create the (hidden) recovery dialog and keep references to its parts."""
+        dialog = tk.Toplevel(self.root)
+        dialog.withdraw()
+        dialog.title("Action Required")
+        dialog.resizable(False, False)
+        dialog.transient(self.root)
+        dialog.configure(bg=Colors.BG)
+        dialog.protocol("WM_DELETE_WINDOW", lambda: None)
 
-            main = tk.Frame(dialog, bg=Colors.BG, padx=25, pady=20)
-            main.pack(fill="both", expand=True)
+        self._set_window_icon(dialog)
 
-            if error_type == "cookie":
-                title = "🔑 Authentication Required"
-            elif error_type == "network":
-                title = "🔌 Connection Lost"
-            else:
-                title = "⚠️ Error Occurred"
+        center_window(dialog, 500, 400)
 
-            tk.Label(
-                main,
-                text=title,
-                font=("Segoe UI", 14, "bold"),
-                bg=Colors.BG,
-                fg=Colors.TEXT,
-            ).pack(anchor="w")
+        main = tk.Frame(dialog, bg=Colors.BG, padx=25, pady=20)
+        main.pack(fill="both", expand=True)
 
-            tk.Label(
-                main,
-                text=f"Progress: {tweets_so_far} tweets saved",
-                font=("Segoe UI", 9),
-                bg=Colors.BG,
-                fg=Colors.TEXT_SECONDARY,
-            ).pack(anchor="w", pady=(2, 10))
+        self._rec_title = tk.Label(
+            main,
+            font=self._font_title,
+            bg=Colors.BG,
+            fg=Colors.TEXT,
+        )
+        self._rec_title.pack(anchor="w")
 
-            error_frame = tk.Frame(main, bg=Colors.BG_SECONDARY, padx=10, pady=10)
-            error_frame.pack(fill="x", pady=(0, 15))
-            tk.Label(
-                error_frame,
-                text=error_msg[:150],
-                font=("Segoe UI", 9),
-                bg=Colors.BG_SECONDARY,
-                fg=Colors.TEXT,
-                wraplength=430,
-                justify="left",
-            ).pack(anchor="w")
+        self._rec_progress = tk.Label(
+            main,
+            font=self._font_ui,
+            bg=Colors.BG,
+            fg=Colors.TEXT_SECONDARY,
+        )
+        self._rec_progress.pack(anchor="w", pady=(2, 10))
 
-            cookie_text = None
-            resume_btn = None
+        error_frame = tk.Frame(main, bg=Colors.BG_SECONDARY, padx=10, pady=10)
+        error_frame.pack(fill="x", pady=(0, 15))
+        self._rec_error = tk.Label(
+            error_frame,
+            font=self._font_ui,
+            bg=Colors.BG_SECONDARY,
+            fg=Colors.TEXT,
+            wraplength=430,
+            justify="left",
+        )
+        self._rec_error.pack(anchor="w")
 
-            if error_type == "cookie":
-                tk.Label(
-                    main,
-                    text="Paste new cookies below:",
-                    font=("Segoe UI", 9),
-                    bg=Colors.BG,
-                    fg=Colors.TEXT,
-                ).pack(anchor="w", pady=(0, 5))
-                cookie_text = tk.Text(
-                    main,
-                    height=5,
-                    font=("Consolas", 9),
-                    bg=Colors.BG_SECONDARY,
-                    relief="solid",
-                    bd=1,
-                )
-                cookie_text.pack(fill="x", pady=(0, 10))
-            elif error_type == "network":
-                tk.Label(
-                    main,
-                    text="Check your internet connection and try again.",
-                    font=("Segoe UI", 9),
-                    bg=Colors.BG,
-                    fg=Colors.TEXT,
-                ).pack(anchor="w", pady=(0, 10))
+        # Holds whichever of the cookie/network sections the error needs
+        body = tk.Frame(main, bg=Colors.BG)
+        body.pack(fill="x")
 
-            feedback = tk.Label(
-                main,
-                text="",
-                font=("Segoe UI", 9),
-                bg=Colors.BG,
-                fg=Colors.TEXT_SECONDARY,
-            )
-            feedback.pack(anchor="w", pady=(0, 10))
-
-            def update_and_resume():
-                if error_type == "cookie" and cookie_text:
-                    raw = cookie_text.get("1.0", tk.END).strip()
-                    if not raw:
-                        feedback.config(
-                            text="Please paste cookies first", fg=Colors.ERROR
-                        )
-                        return
-                    feedback.config(text="Validating...", fg=Colors.TEXT_SECONDARY)
-                    dialog.update()
-                    if convert_editthiscookie_to_twikit_format(raw):
-                        self.user_action = "resume"
-                        close_dialog()
-                    else:
-                        feedback.config(
-                            text="Invalid format. Try again.", fg=Colors.ERROR
-                        )
-                        cookie_text.delete("1.0", tk.END)
-                else:
-                    self.user_action = "resume"
-                    close_dialog()
+        self._rec_cookie_frame = tk.Frame(body, bg=Colors.BG)
+        tk.Label(
+            self._rec_cookie_frame,
+            text="Paste new cookies below:",
+            font=self._font_ui,
+            bg=Colors.BG,
+            fg=Colors.TEXT,
+        ).pack(anchor="w", pady=(0, 5))
+        self._rec_cookie_text = tk.Text(
+            self._rec_cookie_frame,
+            height=5,
+            font=("Consolas", 9),
+            bg=Colors.BG_SECONDARY,
+            relief="solid",
+            bd=1,
+        )
+        self._rec_cookie_text.pack(fill="x", pady=(0, 10))
 
-            def test_conn():
-                feedback.config(text="Testing...", fg=Colors.TEXT_SECONDARY)
-                dialog.update()
-                import urllib.request
+        self._rec_network_label = tk.Label(
+            body,
+            text="Check your internet connection and try again.",
+            font=self._font_ui,
+            bg=Colors.BG,
+            fg=Colors.TEXT,
+        )
 
-                try:
-                    urllib.request.urlopen("https://google.com", timeout=5)
-                    feedback.config(
-                        text="✓ Connected! Click Resume.", fg=Colors.SUCCESS
+        self._rec_feedback = tk.Label(
+            main,
+            text="",
+            font=self._font_ui,
+            bg=Colors.BG,
+            fg=Colors.TEXT_SECONDARY,
+        )
+        self._rec_feedback.pack(anchor="w", pady=(0, 10))
+
+        def update_and_resume():
+            if self._rec_error_type == "cookie":
+                raw = self._rec_cookie_text.get("1.0", tk.END).strip()
+                if not raw:
+                    self._rec_feedback.config(
+                        text="Please paste cookies first", fg=Colors.ERROR
                     )
-                    if resume_btn:
-                        resume_btn.config(state="normal", bg=Colors.PRIMARY)
-                except:
-                    feedback.config(text="✗ Still offline", fg=Colors.ERROR)
+                    return
+                self._rec_feedback.config(
+                    text="Validating...", fg=Colors.TEXT_SECONDARY
+                )
+                self._rec_update_btn.config(state="disabled")
+                threading.Thread(
+                    target=convert_cookies, args=(raw,), daemon=True
+                ).start()
+            else:
+                self._close_recovery_dialog("resume")
 
-            def stop_action():
-                self.user_action = "stop"
-                close_dialog()
+        def convert_cookies(raw):
+            # Large EditThisCookie pastes are parsed off the Tk thread
+            ok = convert_editthiscookie_to_twikit_format(raw)
+            self.root.after(0, show_cookie_result, ok)
 
-            def retry_action():
-                self.user_action = "retry"
-                close_dialog()
+        def show_cookie_result(ok):
+            if self._rec_on_close is None:
+                return
+            if ok:
+                self._close_recovery_dialog("resume")
+            else:
+                self._rec_feedback.config(
+                    text="Invalid format. Try again.", fg=Colors.ERROR
+                )
+                self._rec_cookie_text.delete("1.0", tk.END)
+                self._rec_update_btn.config(state="normal")
 
-            def close_dialog():
-                dialog.grab_release()
-                dialog.destroy()
-                dialog_closed.set()
+        def test_conn():
+            self._rec_feedback.config(text="Testing...", fg=Colors.TEXT_SECONDARY)
+            threading.Thread(target=probe_connection, daemon=True).start()
 
-            btn_frame = tk.Frame(main, bg=Colors.BG)
-            btn_frame.pack(fill="x", pady=(10, 0))
+        def probe_connection():
+            # Plain TCP connect off the Tk thread; no TLS or HTTP round-trip
+            try:
+                with socket.create_connection(CONNECTIVITY_PROBE, timeout=5):
+                    ok = True
+            except OSError:
+                ok = False
+            self.root.after(0, show_probe_result, ok)
+
+        def show_probe_result(ok):
+            if self._rec_on_close is None:
+                return
+            if ok:
+                self._rec_feedback.config(
+                    text="✓ Connected! Click Resume.", fg=Colors.SUCCESS
+                )
+                self._rec_resume_btn.config(state="normal", bg=Colors.PRIMARY)
+            else:
+                self._rec_feedback.config(text="✗ Still offline", fg=Colors.ERROR)
 
-            stop_btn = tk.Button(
-                btn_frame,
-                text="Stop & Save",
-                command=stop_action,
-                bg=Colors.BG_SECONDARY,
-                fg=Colors.TEXT,
-                font=("Segoe UI", 9),
-                relief="flat",
-                cursor="hand2",
-                padx=12,
-                pady=6,
-            )
-            stop_btn.pack(side="left")
+        btn_frame = tk.Frame(main, bg=Colors.BG)
+        btn_frame.pack(fill="x", pady=(10, 0))
 
-            if error_type == "network":
-                test_btn = tk.Button(
-                    btn_frame,
-                    text="Test Connection",
-                    command=test_conn,
-                    bg=Colors.BG_SECONDARY,
-                    fg=Colors.TEXT,
-                    font=("Segoe UI", 9),
-                    relief="flat",
-                    cursor="hand2",
-                    padx=12,
-                    pady=6,
-                )
-                test_btn.pack(side="right", padx=(8, 0))
+        stop_btn = tk.Button(
+            btn_frame,
+            text="Stop & Save",
+            command=lambda: self._close_recovery_dialog("stop"),
+            bg=Colors.BG_SECONDARY,
+            fg=Colors.TEXT,
+            font=self._font_ui,
+            relief="flat",
+            cursor="hand2",
+            padx=12,
+            pady=6,
+        )
+        stop_btn.pack(side="left")
 
-                resume_btn = tk.Button(
-                    btn_frame,
-                    text="Resume",
-                    command=update_and_resume,
-                    state="disabled",
-                    bg=Colors.BG_SECONDARY,
-                    fg=Colors.TEXT_SECONDARY,
-                    font=("Segoe UI", 9),
-                    relief="flat",
-                    cursor="hand2",
-                    padx=12,
-                    pady=6,
-                )
-                resume_btn.pack(side="right")
-            elif error_type == "cookie":
-                update_btn = tk.Button(
-                    btn_frame,
-                    text="Update & Resume",
-                    command=update_and_resume,
-                    bg=Colors.PRIMARY,
-                    fg="white",
-                    font=("Segoe UI", 9),
-                    relief="flat",
-                    cursor="hand2",
-                    padx=12,
-                    pady=6,
-                )
-                update_btn.pack(side="right")
-            else:
-                retry_btn = tk.Button(
-                    btn_frame,
-                    text="Retry",
-                    command=retry_action,
-                    bg=Colors.PRIMARY,
-                    fg="white",
-                    font=("Segoe UI", 9),
-                    relief="flat",
-                    cursor="hand2",
-                    padx=12,
-                    pady=6,
-                )
-                retry_btn.pack(side="right")
+        self._rec_test_btn = tk.Button(
+            btn_frame,
+            text="Test Connection",
+            command=test_conn,
+            bg=Colors.BG_SECONDARY,
+            fg=Colors.TEXT,
+            font=self._font_ui,
+            relief="flat",
+            cursor="hand2",
+            padx=12,
+            pady=6,
+        )
+        self._rec_resume_btn = tk.Button(
+            btn_frame,
+            text="Resume",
+            command=update_and_resume,
+            state="disabled",
+            bg=Colors.BG_SECONDARY,
+            fg=Colors.TEXT_SECONDARY,
+            font=self._font_ui,
+            relief="flat",
+            cursor="hand2",
+            padx=12,
+            pady=6,
+        )
+        self._rec_update_btn = tk.Button(
+            btn_frame,
+            text="Update & Resume",
+            command=update_and_resume,
+            bg=Colors.PRIMARY,
+            fg="white",
+            font=self._font_ui,
+            relief="flat",
+            cursor="hand2",
+            padx=12,
+            pady=6,
+        )
+        self._rec_retry_btn = tk.Button(
+            btn_frame,
+            text="Retry",
+            command=lambda: self._close_recovery_dialog("retry"),
+            bg=Colors.PRIMARY,
+            fg="white",
+            font=self._font_ui,
+            relief="flat",
+            cursor="hand2",
+            padx=12,
+            pady=6,
+        )
 
-            dialog.focus_force()
-            if cookie_text:
-                cookie_text.focus()
+        self._rec_dialog = dialog
+        self._rec_dark = Colors.is_dark_mode()
 
-        self.root.after(0, show_dialog)
-        dialog_closed.wait(timeout=3600)
-        return self.user_action
+    def _populate_recovery_dialog(self, error_type, error_msg, tweets_so_far):
+        """Fill the recovery dialog in for one error and show the right controls."""
+        self._rec_error_type = error_type
 
-    def _wait_for_user_action(self, error_type, error_msg, context=None):
         if error_type == "cookie":
-            self.paused_for_cookies = True
+            title = "🔑 Authentication Required"
         elif error_type == "network":
-            self.paused_for_network = True
+            title = "🔌 Connection Lost"
         else:
-            self.paused_for_error = True
+            title = "⚠️ Error Occurred"
+
+        self._rec_title.config(text=title)
+        self._rec_progress.config(text=f"Progress: {tweets_so_far} tweets saved")
+        self._rec_error.config(text=error_msg[:150])
+        self._rec_feedback.config(text="", fg=Colors.TEXT_SECONDARY)
+
+        for widget in (
+            self._rec_cookie_frame,
+            self._rec_network_label,
+            self._rec_test_btn,
+            self._rec_resume_btn,
+            self._rec_update_btn,
+            self._rec_retry_btn,
+        ):
+            widget.pack_forget()
 
-        action = self._show_error_recovery_dialog(error_type, error_msg, context)
-
-        self.paused_for_cookies = False
-        self.paused_for_network = False
-        self.paused_for_error = False
-        return action
+        if error_type == "cookie":
+            self._rec_cookie_text.delete("1.0", tk.END)
+            self._rec_cookie_frame.pack(fill="x")
+            self._rec_update_btn.config(state="normal")
+            self._rec_update_btn.pack(side="right")
+        elif error_type == "network":
+            self._rec_network_label.pack(anchor="w", pady=(0, 10))
+            self._rec_test_btn.pack(side="right", padx=(8, 0))
+            self._rec_resume_btn.config(state="disabled", bg=Colors.BG_SECONDARY)
+            self._rec_resume_btn.pack(side="right")
+        else:
+            self._rec_retry_btn.pack(side="right")
+
+    def _close_recovery_dialog(self, action):
+        """Record the user's choice and hide the recovery dialog for reuse."""
+        self.user_action = action
+        self._rec_dialog.grab_release()
+        self._rec_dialog.withdraw()
+        on_close, self._rec_on_close = self._rec_on_close, None
+        if on_close:
+            on_close(action)
+
+    def _set_paused(self, error_type):
+        """Flag what the scrape is paused for; ``None`` clears all flags."""
+        self.paused_for_cookies = error_type == "cookie"
+        self.paused_for_network = error_type == "network"
+        self.paused_for_error = error_type not in (None, "cookie", "network")
+
+    async def _await_user_action(self, error_type, error_msg, context=None):
+        """Pause the scrape on the recovery dialog and return the user's choice.
+
+        The dialog resolves a future on this loop, so nothing is parked
+        while it is open. Returns ``None`` if there's no answer in an hour.
+        """
+        loop = asyncio.get_running_loop()
+        choice = loop.create_future()
+
+        def resolve(action):
+            # The wait may have timed out and cancelled the future already
+            if not choice.done():
+                choice.set_result(action)
+
+        self._set_paused(error_type)
+        self._show_error_recovery_dialog(
+            error_type,
+            error_msg,
+            context,
+            on_close=lambda action: loop.call_soon_threadsafe(resolve, action),
+        )
+        try:
+            return await asyncio.wait_for(choice, timeout=3600)
+        except asyncio.TimeoutError:
+            return None
+        finally:
+            self._set_paused(None)
 
     # ========================================
     # HELPER METHODS
@@ -1467,6 +1850,9 @@ class TweetScraperApp:
 
     def toggle_batch(self):
         on = self.batch_var.get()
+        if on == self._batch_widgets_on:
+            return
+        self._batch_widgets_on = on
         state = "normal" if on else "disabled"
         self.file_btn.config(state=state)
         self.mode_menu.config(state="disabled" if on else "readonly")
@@ -1474,6 +1860,9 @@ class TweetScraperApp:
 
     def toggle_break_settings(self):
         state = "normal" if self.enable_breaks_var.get() else "disabled"
+        if state == self._break_spins_state:
+            return
+        self._break_spins_state = state
         self.tweet_interval_spin.config(state=state)
         self.min_break_spin.config(state=state)
         self.max_break_spin.config(state=state)
@@ -1484,24 +1873,25 @@ class TweetScraperApp:
             self.save_dir.set(folder)
 
     def select_file(self):
-        path = filedialog.askopenfilename(
-            filetypes=[("Text/CSV", "*.txt;*.csv"), ("All", "*.*")]
-        )
+        path = filedialog.askopenfilename(filetypes=USERNAME_FILETYPES)
         if path:
             self.file_path = path
             self.log(f"✓ Loaded: {os.path.basename(path)}")
 
     def select_links_file(self):
-        path = filedialog.askopenfilename(
-            filetypes=[("Text", "*.txt"), ("Excel", "*.xlsx;*.xls"), ("All", "*.*")]
-        )
+        path = filedialog.askopenfilename(filetypes=LINKS_FILETYPES)
         if path:
             self.links_file_path = path
             self.links_file_var.set(path)
             self.links_log(f"✓ Loaded: {os.path.basename(path)}")
 
     def update_mode(self, *_):
-        if self.mode_var.get() == "Username":
+        # Re-selecting the current mode leaves the layout as it is
+        mode = self.mode_var.get()
+        if mode == self._shown_mode:
+            return
+        self._shown_mode = mode
+        if mode == "Username":
             self.input_label.config(text="Username:")
             self.username_entry.grid(row=0, column=0, sticky="ew")
             self.keyword_entry.grid_remove()
@@ -1514,43 +1904,112 @@ class TweetScraperApp:
 
     def _on_time_focus_in(self, event, default):
         w = event.widget
-        if w.get() == default:
+        if w in self._time_placeholders:
+            self._time_placeholders.discard(w)
             w.delete(0, tk.END)
             w.config(foreground="black")
 
     def _validate_time_entry(self, event):
         w = event.widget
         val = w.get().strip()
-        default = "00:00:00" if w == self.start_time_entry else "23:59:59"
         if not val:
+            default = "00:00:00" if w == self.start_time_entry else "23:59:59"
+            w.delete(0, tk.END)
             w.insert(0, default)
             w.config(foreground="gray")
-            return
-        try:
-            datetime.strptime(val, "%H:%M:%S")
+            self._time_placeholders.add(w)
+        elif TIME_RE.match(val):
+            # Write back the canonical zero-padded HH:MM:SS
+            hour, minute, second = parse_time(val)
+            w.delete(0, tk.END)
+            w.insert(0, f"{hour:02d}:{minute:02d}:{second:02d}")
             w.config(foreground="black")
-        except:
-            try:
-                datetime.strptime(val, "%H:%M")
-                w.delete(0, tk.END)
-                w.insert(0, f"{val}:00")
-                w.config(foreground="black")
-            except:
-                w.delete(0, tk.END)
-                w.insert(0, default)
-                w.config(foreground="gray")
+        else:
+            # Keep what the user typed, flagged; submit reports the error
+            w.config(foreground=Colors.ERROR)
+
+    def _log_timestamp(self):
+        """Return the ``HH:MM:SS`` log stamp, formatted once per second."""
+        now = int(time_module.time())
+        second, ts = self._ts_cache
+        if second != now:
+            ts = time_module.strftime("%H:%M:%S", time_module.localtime(now))
+            self._ts_cache = (now, ts)
+        return ts
 
     def log(self, msg):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.log_text.insert(tk.END, f"[{ts}] {msg}\n")
-        self.log_text.see(tk.END)
+        self._queue_log("log_text", f"[{self._log_timestamp()}] {msg}\n")
 
     def links_log(self, msg):
-        ts = datetime.now().strftime("%H:%M:%S")
-        self.links_log_text.insert(tk.END, f"[{ts}] {msg}\n")
-        self.links_log_text.see(tk.END)
+        self._queue_log("links_log_text", f"[{self._log_timestamp()}] {msg}\n")
+
+    def _queue_log(self, name, line):
+        """Buffer a line for the named log widget and schedule a flush."""
+        self._log_q.append((name, line))
+        if not self._log_flush_scheduled:
+            self._log_flush_scheduled = True
+            self.root.after(LOG_FLUSH_MS, self._flush_logs)
+
+    def _flush_logs(self):
+        """Write queued log lines with one insert per visible widget."""
+        # Clear the flag before draining so a line queued mid-flush
+        # schedules the next one
+        self._log_flush_scheduled = False
+        try:
+            for _ in range(LOG_FLUSH_BATCH):
+                name, line = self._log_q.popleft()
+                self._held_logs[name].append(line)
+        except IndexError:
+            pass
+        hidden = False
+        for name, held in self._held_logs.items():
+            if not held:
+                continue
+            if name == "links_log_text":
+                self._ensure_links_tab()
+            widget = getattr(self, name)
+            # Hidden widgets (other tab, minimised window) keep their lines
+            # until they're shown; the deque caps what is held meanwhile
+            if not widget.winfo_viewable():
+                hidden = True
+                continue
+            text = "".join(held)
+            held.clear()
+            # Only follow new output if the user hasn't scrolled back
+            at_bottom = widget.yview()[1] >= 0.999
+            widget.insert(tk.END, text)
+            self._trim_log(widget)
+            if at_bottom:
+                widget.see(tk.END)
+        if not self._log_flush_scheduled and (self._log_q or hidden):
+            self._log_flush_scheduled = True
+            self.root.after(
+                LOG_FLUSH_MS if self._log_q else LOG_HIDDEN_RETRY_MS,
+                self._flush_logs,
+            )
+
+    def _post_count(self, count):
+        """Record the latest scraped count; the label timer picks it up."""
+        self._latest_count = count
+
+    def _tick_count_label(self):
+        count = self._latest_count
+        if count is not None and count != self._shown_count:
+            # Colour changes once per scrape; after that only the text does
+            if self._shown_count is None:
+                self.count_lbl.config(fg=Colors.SUCCESS)
+            self._shown_count = count
+            self.count_var.set(f"Scraped: {count}")
+        self.root.after(COUNT_TICK_MS, self._tick_count_label)
+
+    def _trim_log(self, widget):
+        """Drop the oldest lines once a log widget exceeds MAX_LOG_LINES."""
+        lines = int(widget.index("end-1c").split(".")[0])
+        if lines > MAX_LOG_LINES:
+            widget.delete("1.0", f"{lines - MAX_LOG_LINES}.0")
 
     def clear_logs(self):
+        self._held_logs["log_text"].clear()
         self.log_text.delete("1.0", tk.END)
 
     def save_cookies(self):
@@ -1568,15 +2027,25 @@ class TweetScraperApp:
     def get_break_settings(self):
         if not self.enable_breaks_var.get():
             return None
+        raw = (
+            self.tweet_interval_spin.get(),
+            self.min_break_spin.get(),
+            self.max_break_spin.get(),
+        )
+        # Reuse the parsed settings while the spinbox values are unchanged
+        if raw == self._break_cache[0]:
+            return self._break_cache[1]
         try:
-            return {
+            settings = {
                 "enabled": True,
-                "tweet_interval": int(self.tweet_interval_var.get()),
-                "min_break_minutes": int(self.min_break_var.get()),
-                "max_break_minutes": int(self.max_break_var.get()),
+                "tweet_interval": int(raw[0]),
+                "min_break_minutes": int(raw[1]),
+                "max_break_minutes": int(raw[2]),
             }
-        except:
-            return None
+        except ValueError:
+            settings = None
+        self._break_cache = (raw, settings)
+        return settings
 
     # ========================================
     # API METHODS
@@ -1607,6 +2076,15 @@ class TweetScraperApp:
         """Handle scraping method selection change."""
         selected = self.method_var.get()
         method_value = self.method_display_map.get(selected, "cookie")
+        # Re-selecting the active method changes nothing, unless it is an
+        # API method still missing its key: then the prompt below is the
+        # way back to adding one
+        if method_value == self.scraping_method.get() and (
+            method_value == "cookie"
+            or not API_MODULE_AVAILABLE
+            or get_api_key(method_value)
+        ):
+            return
         
         # Check if disabled option selected
         if method_value.startswith("_") and method_value.endswith("_disabled"):
@@ -1694,28 +2172,27 @@ class TweetScraperApp:
             self.show_api_key_dialog()
 
     def _update_save_dir_placeholder(self):
-        """Update save directory display with placeholder if empty."""
-        if not self.save_dir.get():
+        """Fall back to the default exports folder if save_dir is unusable."""
+        # One stat at startup; later changes come from the folder picker
+        current = self.save_dir.get()
+        if not current or not os.path.isdir(current):
             # Create default exports folder
             default_dir = os.path.join(os.path.dirname(__file__), "..", "data", "exports")
-            os.makedirs(default_dir, exist_ok=True)
+            if not os.path.isdir(default_dir):
+                os.makedirs(default_dir, exist_ok=True)
             self.save_dir.set(os.path.abspath(default_dir))
 
     def show_cookie_dialog(self):
         """Show cookie input dialog."""
         dialog = tk.Toplevel(self.root)
         dialog.title("Update Cookies")
-        dialog.geometry("550x350")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 275
-        y = (dialog.winfo_screenheight() // 2) - 175
-        dialog.geometry(f"550x350+{x}+{y}")
+        center_window(dialog, 550, 350)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=20, pady=15)
         main.pack(fill="both", expand=True)
@@ -1773,7 +2250,7 @@ class TweetScraperApp:
             cursor="hand2",
         )
         help_link.pack(side="left", padx=(5, 0))
-        help_link.bind("<Button-1>", lambda e: webbrowser.open("https://youtu.be/RKX2sgQVgBg"))
+        help_link.bind("<Button-1>", partial(open_url, SETUP_VIDEO_URL))
         
         # Buttons
         btn_frame = tk.Frame(main, bg=Colors.BG)
@@ -1854,23 +2331,14 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title("API Key Management")
-        dialog.geometry("550x400")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.configure(bg=Colors.BG)
 
-        try:
-            icon_path = resource_path(os.path.join("assets", "logo.ico"))
-            if os.path.exists(icon_path):
-                dialog.iconbitmap(icon_path)
-        except:
-            pass
+        self._set_window_icon(dialog)
 
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 275
-        y = (dialog.winfo_screenheight() // 2) - 200
-        dialog.geometry(f"550x400+{x}+{y}")
+        center_window(dialog, 550, 400)
 
         main = tk.Frame(dialog, bg=Colors.BG, padx=20, pady=15)
         main.pack(fill="both", expand=True)
@@ -1941,7 +2409,7 @@ class TweetScraperApp:
             signup_url = info.get('signup_url') or info.get('website', '')
             if signup_url:
                 def make_open_link(url):
-                    return lambda e: webbrowser.open(url)
+                    return partial(open_url, url)
                 
                 link_lbl = tk.Label(
                     top_row,
@@ -2129,30 +2597,25 @@ class TweetScraperApp:
         if preset_name == "Custom":
             return
         
-        presets = get_date_presets()
-        for name, start, end in presets:
-            if name == preset_name:
-                self.start_entry.delete(0, tk.END)
-                self.start_entry.insert(0, start)
-                self.end_entry.delete(0, tk.END)
-                self.end_entry.insert(0, end)
-                break
+        # Preset dates are relative to today, so only the names are cached
+        dates = {name: (start, end) for name, start, end in get_date_presets()}
+        if preset_name in dates:
+            start, end = dates[preset_name]
+            self.start_entry.delete(0, tk.END)
+            self.start_entry.insert(0, start)
+            self.end_entry.delete(0, tk.END)
+            self.end_entry.insert(0, end)
 
     def show_cost_estimate(self):
         """Show estimated cost dialog."""
         method = self.scraping_method.get() if hasattr(self, 'scraping_method') else "cookie"
         
         # Calculate date range days
-        try:
-            start = self.start_entry.get().strip()
-            end = self.end_entry.get().strip()
-            if start and end:
-                start_dt = datetime.strptime(start, "%Y-%m-%d")
-                end_dt = datetime.strptime(end, "%Y-%m-%d")
-                days = (end_dt - start_dt).days + 1
-            else:
-                days = 30
-        except:
+        start_dt = parse_date(self.start_entry.get().strip())
+        end_dt = parse_date(self.end_entry.get().strip())
+        if start_dt and end_dt:
+            days = (end_dt - start_dt).days + 1
+        else:
             days = 30
         
         # Rough estimate: 5-20 tweets per day depending on user
@@ -2188,17 +2651,13 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Filter Settings")
-        dialog.geometry("400x350")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 200
-        y = (dialog.winfo_screenheight() // 2) - 175
-        dialog.geometry(f"400x350+{x}+{y}")
+        center_window(dialog, 400, 350)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=20, pady=15)
         main.pack(fill="both", expand=True)
@@ -2259,7 +2718,7 @@ class TweetScraperApp:
             try:
                 self.filters.min_likes = int(self._filter_min_likes.get())
                 self.filters.min_retweets = int(self._filter_min_rt.get())
-            except:
+            except ValueError:
                 pass
             self.filters.exclude_retweets = self._filter_excl_rt.get()
             self.filters.exclude_replies = self._filter_excl_replies.get()
@@ -2298,16 +2757,12 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Scrape History")
-        dialog.geometry("700x450")
         dialog.resizable(True, True)
         dialog.transient(self.root)
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 350
-        y = (dialog.winfo_screenheight() // 2) - 225
-        dialog.geometry(f"700x450+{x}+{y}")
+        center_window(dialog, 700, 450)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=15, pady=10)
         main.pack(fill="both", expand=True)
@@ -2426,17 +2881,13 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title(f"Preview - {len(tweets)} tweets")
-        dialog.geometry("800x500")
         dialog.resizable(True, True)
         dialog.transient(self.root)
         dialog.grab_set()
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 400
-        y = (dialog.winfo_screenheight() // 2) - 250
-        dialog.geometry(f"800x500+{x}+{y}")
+        center_window(dialog, 800, 500)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=15, pady=10)
         main.pack(fill="both", expand=True)
@@ -2536,33 +2987,30 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Scrape Analytics")
-        dialog.geometry("450x550")
         dialog.resizable(False, False)
         dialog.transient(self.root)
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 225
-        y = (dialog.winfo_screenheight() // 2) - 275
-        dialog.geometry(f"450x550+{x}+{y}")
+        center_window(dialog, 450, 550)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=20, pady=15)
         main.pack(fill="both", expand=True)
         
-        # Text area with analytics
-        text = tk.Text(
+        # Read-only summary; a Label draws it without a Text widget's
+        # editing and wrap machinery
+        tk.Label(
             main,
+            text=summary,
             font=("Consolas", 10),
             bg=Colors.BG_SECONDARY,
-            relief="flat",
-            wrap=tk.WORD,
+            fg=Colors.TEXT,
+            justify="left",
+            anchor="nw",
+            wraplength=380,
             padx=15,
             pady=10,
-        )
-        text.pack(fill="both", expand=True)
-        text.insert("1.0", summary)
-        text.config(state="disabled")
+        ).pack(fill="both", expand=True)
         
         # Close button
         tk.Button(
@@ -2579,16 +3027,12 @@ class TweetScraperApp:
         
         dialog = tk.Toplevel(self.root)
         dialog.title("Scrape Queue")
-        dialog.geometry("500x400")
         dialog.resizable(True, True)
         dialog.transient(self.root)
         dialog.configure(bg=Colors.BG)
         
         # Center dialog
-        dialog.update_idletasks()
-        x = (dialog.winfo_screenwidth() // 2) - 250
-        y = (dialog.winfo_screenheight() // 2) - 200
-        dialog.geometry(f"500x400+{x}+{y}")
+        center_window(dialog, 500, 400)
         
         main = tk.Frame(dialog, bg=Colors.BG, padx=15, pady=10)
         main.pack(fill="both", expand=True)
@@ -2795,7 +3239,9 @@ class TweetScraperApp:
         """
         state = {"mode": mode, **kwargs}
         self.current_scrape_state = state
-        self.state_manager.save_state(state)
+        # Batch scrapes save around every user; coalesce the writes
+        self.state_manager.save_state_debounced(state)
+        self._state_saved_at = time_module.monotonic()
 
     def check_for_saved_state(self):
         if self.state_manager.has_saved_state():
@@ -2812,34 +3258,23 @@ class TweetScraperApp:
         if not state:
             return
         mode = state.get("mode")
-        if mode == "single":
-            self.resume_single_scrape(state)
-        elif mode == "batch":
-            self.resume_batch_scrape(state)
+        if mode in ("single", "batch"):
+            self._start_scrape_from_state(state, state.get("settings", {}))
         elif mode == "links":
             self.resume_links_scrape(state)
 
-    def resume_single_scrape(self, state):
-        settings = state.get("settings", {})
-        self._start_scrape_from_state(state, settings)
-
-    def resume_batch_scrape(self, state):
-        settings = state.get("settings", {})
-        self._start_scrape_from_state(state, settings)
-
     def resume_links_scrape(self, state):
+        load_scraper()
+        self._ensure_links_tab()
         self.links_file_path = state.get("links_file_path")
         self.links_file_var.set(self.links_file_path or "")
         settings = state.get("settings", {})
         fmt = settings.get("export_format", "excel").lower()
         save_dir = settings.get("save_dir", self.save_dir.get())
-        threading.Thread(
-            target=self._run_links,
-            args=(self.links_file_path, fmt, save_dir, None),
-            daemon=True,
-        ).start()
+        self._submit(self._run_links(self.links_file_path, fmt, save_dir, None))
 
     def _start_scrape_from_state(self, state, settings):
+        load_scraper()
         start = settings.get("start_date", "")
         end = settings.get("end_date", "")
         fmt = settings.get("export_format", "excel").lower()
@@ -2856,32 +3291,26 @@ class TweetScraperApp:
             target = ("single", user, kws)
 
         self.current_task_type = "main"
-        self._stop_requested = False
+        self._stop_evt.clear()
         self._is_running = True
         self.scrape_button.config(state="disabled")
         self.stop_btn.config(state="normal")
-        self.progress.grid()
-        self.progress.start(30)
-        threading.Thread(
-            target=self._run_scrape,
-            args=(target, start, end, fmt, save_dir, None),
-            daemon=True,
-        ).start()
+        self._show_progress()
+        self._submit(
+            self._run_scrape(target, start, end, fmt, save_dir, None, resuming=True)
+        )
 
     # ========================================
     # SCRAPING METHODS
     # ========================================
-    def _run_scrape(self, target, start, end, fmt, save_dir, break_settings):
+    async def _run_scrape(
+        self, target, start, end, fmt, save_dir, break_settings, resuming=False
+    ):
         def progress_cb(msg):
             if isinstance(msg, str):
                 self.log(msg)
             else:
-                self.root.after(
-                    0,
-                    lambda: self.count_lbl.config(
-                        text=f"Scraped: {msg}", fg=Colors.SUCCESS
-                    ),
-                )
+                self._post_count(msg)
 
         def cookie_cb(msg):
             self.log(f"🔑 {msg}")
@@ -2889,16 +3318,36 @@ class TweetScraperApp:
         def network_cb(msg):
             self.log(f"🔌 {msg}")
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
-
         try:
+            if not self._preflight_paths(save_dir):
+                return
+            target = self._load_batch_target(target)
+            if target is None:
+                return
             if target[0] == "batch":
 
                 async def batch():
                     total = 0
                     users = target[1]
-                    all_seen_ids = set()  # ADD THIS LINE
+                    # IDs already recorded in the sidecar file by an
+                    # interrupted run; a fresh batch starts a new file
+                    if resuming:
+                        all_seen_ids = self.state_manager.load_seen_ids()
+                    else:
+                        self.state_manager.reset_seen_ids()
+                        all_seen_ids = set()
+
+                    # Fields shared by every checkpoint in this batch
+                    batch_state = {
+                        "usernames": users,
+                        "seen_tweet_ids_path": self.state_manager.seen_ids_file,
+                        "settings": {
+                            "start_date": start,
+                            "end_date": end,
+                            "export_format": fmt,
+                            "save_dir": save_dir,
+                        },
+                    }
 
                     for i, u in enumerate(users):
                         if (
@@ -2910,17 +3359,11 @@ class TweetScraperApp:
                         # Save state BEFORE scraping (without output_path yet)
                         self.save_scrape_state(
                             "batch",
-                            usernames=users,
                             current_index=i,
                             current_username=u,
                             tweets_scraped=total,
-                            seen_tweet_ids=list(all_seen_ids),
-                            settings={
-                                "start_date": start,
-                                "end_date": end,
-                                "export_format": fmt,
-                                "save_dir": save_dir,
-                            },
+                            seen_tweet_count=len(all_seen_ids),
+                            **batch_state,
                         )
 
                         retry = 0
@@ -2932,56 +3375,53 @@ class TweetScraperApp:
                                     end_date=end,
                                     export_format=fmt,
                                     progress_callback=progress_cb,
-                                    should_stop_callback=self._should_stop,
+                                    should_stop_callback=self._stop_evt.is_set,
                                     cookie_expired_callback=cookie_cb,
                                     network_error_callback=network_cb,
                                     save_dir=save_dir,
                                     break_settings=break_settings,
                                 )
                                 total += cnt
-                                all_seen_ids.update(seen_ids)  # Add the returned IDs
+                                # Only IDs not seen before go to the sidecar file
+                                new_ids = set(seen_ids) - all_seen_ids
+                                all_seen_ids.update(new_ids)
+                                self.state_manager.append_seen_ids(new_ids)
 
                                 # Save state AFTER scraping (now with output_path)
                                 self.save_scrape_state(
                                     "batch",
-                                    usernames=users,
                                     current_index=i
                                     + 1,  # Increment because this user is done
                                     current_username=u,
                                     tweets_scraped=total,
-                                    seen_tweet_ids=list(all_seen_ids),
+                                    seen_tweet_count=len(all_seen_ids),
                                     output_path=out,
-                                    settings={
-                                        "start_date": start,
-                                        "end_date": end,
-                                        "export_format": fmt,
-                                        "save_dir": save_dir,
-                                    },
+                                    **batch_state,
                                 )
 
                                 progress_cb(f"✓ {cnt} tweets for @{u}")
                                 break
                             except CookieExpiredError:
-                                action = self._wait_for_user_action(
+                                action = await self._await_user_action(
                                     "cookie",
                                     "Cookies expired",
                                     {
                                         "tweets_scraped": total,
-                                        "seen_tweet_ids": list(all_seen_ids),
+                                        "seen_tweet_count": len(all_seen_ids),
                                     },
                                 )
                                 if action == "stop":
                                     return total
                                 retry += 1
                             except NetworkError as e:
-                                action = self._wait_for_user_action(
+                                action = await self._await_user_action(
                                     "network", str(e), {"tweets_scraped": total}
                                 )
                                 if action == "stop":
                                     return total
                                 retry += 1
                             except Exception as e:
-                                action = self._wait_for_user_action(
+                                action = await self._await_user_action(
                                     "unknown", str(e), {"tweets_scraped": total}
                                 )
                                 if action == "stop":
@@ -2990,10 +3430,11 @@ class TweetScraperApp:
                     self.state_manager.clear_state()
                     return total
 
-                self.task = loop.create_task(batch())
-                total = loop.run_until_complete(self.task)
+                total = await batch()
                 self.log(f"✓ Done! {total} tweets total")
-                messagebox.showinfo("Complete", f"Scraped {total} tweets!")
+                self._show_message_async(
+                    messagebox.showinfo, "Complete", f"Scraped {total} tweets!"
+                )
             else:
                 _, user, kws = target
 
@@ -3026,7 +3467,7 @@ class TweetScraperApp:
                                 use_and=self.op_var.get() == "AND",
                                 export_format=fmt,
                                 progress_callback=progress_cb,
-                                should_stop_callback=self._should_stop,
+                                should_stop_callback=self._stop_evt.is_set,
                                 cookie_expired_callback=cookie_cb,
                                 network_error_callback=network_cb,
                                 save_dir=save_dir,
@@ -3037,7 +3478,7 @@ class TweetScraperApp:
                             return out, cnt
                         except CookieExpiredError:
                             resume_state = self.state_manager.load_state()
-                            action = self._wait_for_user_action(
+                            action = await self._await_user_action(
                                 "cookie",
                                 "Cookies expired",
                                 {
@@ -3053,7 +3494,7 @@ class TweetScraperApp:
                             retry += 1
                         except NetworkError as e:
                             resume_state = self.state_manager.load_state()
-                            action = self._wait_for_user_action(
+                            action = await self._await_user_action(
                                 "network",
                                 str(e),
                                 {
@@ -3069,7 +3510,7 @@ class TweetScraperApp:
                             retry += 1
                         except Exception as e:
                             resume_state = self.state_manager.load_state()
-                            action = self._wait_for_user_action(
+                            action = await self._await_user_action(
                                 "unknown",
                                 str(e),
                                 {
@@ -3085,11 +3526,11 @@ class TweetScraperApp:
                             retry += 1
                     return None, 0
 
-                self.task = loop.create_task(single())
-                out, cnt = loop.run_until_complete(self.task)
+                out, cnt = await single()
                 if out:
                     self.log(f"✓ Done! {cnt} tweets saved")
-                    messagebox.showinfo(
+                    self._show_message_async(
+                        messagebox.showinfo,
                         "Complete", f"Scraped {cnt} tweets!\n\nSaved to:\n{out}"
                     )
         except asyncio.CancelledError:
@@ -3099,94 +3540,93 @@ class TweetScraperApp:
         finally:
             self._cleanup_after_scrape()
 
-    def _run_links(self, path, fmt, save_dir, break_settings):
+    async def _run_links(self, path, fmt, save_dir, break_settings):
         def progress_cb(msg):
             if isinstance(msg, str):
                 self.links_log(msg)
             else:
-                self.root.after(
-                    0,
-                    lambda: self.count_lbl.config(
-                        text=f"Scraped: {msg}", fg=Colors.SUCCESS
-                    ),
-                )
+                self._post_count(msg)
 
-        loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(loop)
+        async def links_task():
+            retry = 0
+            resume_state = None
+            while retry < 5:
+                try:
+                    out, cnt, failed, _ = await scrape_tweet_links_file(
+                        file_path=path,
+                        links=links,
+                        export_format=fmt,
+                        save_dir=save_dir,
+                        progress_callback=progress_cb,
+                        should_stop_callback=self._stop_evt.is_set,
+                        break_settings=break_settings,
+                        resume_state=resume_state,
+                    )
+                    self.state_manager.clear_state()
+                    return out, cnt, failed
+                except CookieExpiredError:
+                    resume_state = self.state_manager.load_state()
+                    action = await self._await_user_action(
+                        "cookie",
+                        "Cookies expired",
+                        {
+                            "tweets_scraped": (
+                                resume_state.get("tweets_scraped", 0)
+                                if resume_state
+                                else 0
+                            )
+                        },
+                    )
+                    if action == "stop":
+                        return None, 0, 0
+                    retry += 1
+                except NetworkError as e:
+                    resume_state = self.state_manager.load_state()
+                    action = await self._await_user_action(
+                        "network",
+                        str(e),
+                        {
+                            "tweets_scraped": (
+                                resume_state.get("tweets_scraped", 0)
+                                if resume_state
+                                else 0
+                            )
+                        },
+                    )
+                    if action == "stop":
+                        return None, 0, 0
+                    retry += 1
+                except Exception as e:
+                    resume_state = self.state_manager.load_state()
+                    action = await self._await_user_action(
+                        "unknown",
+                        str(e),
+                        {
+                            "tweets_scraped": (
+                                resume_state.get("tweets_scraped", 0)
+                                if resume_state
+                                else 0
+                            )
+                        },
+                    )
+                    if action == "stop":
+                        return None, 0, 0
+                    retry += 1
+            return None, 0, 0
 
         try:
-
-            async def links_task():
-                retry = 0
-                resume_state = None
-                while retry < 5:
-                    try:
-                        out, cnt, failed, _ = await scrape_tweet_links_file(
-                            file_path=path,
-                            export_format=fmt,
-                            save_dir=save_dir,
-                            progress_callback=progress_cb,
-                            should_stop_callback=self._should_stop,
-                            break_settings=break_settings,
-                            resume_state=resume_state,
-                        )
-                        self.state_manager.clear_state()
-                        return out, cnt, failed
-                    except CookieExpiredError:
-                        resume_state = self.state_manager.load_state()
-                        action = self._wait_for_user_action(
-                            "cookie",
-                            "Cookies expired",
-                            {
-                                "tweets_scraped": (
-                                    resume_state.get("tweets_scraped", 0)
-                                    if resume_state
-                                    else 0
-                                )
-                            },
-                        )
-                        if action == "stop":
-                            return None, 0, 0
-                        retry += 1
-                    except NetworkError as e:
-                        resume_state = self.state_manager.load_state()
-                        action = self._wait_for_user_action(
-                            "network",
-                            str(e),
-                            {
-                                "tweets_scraped": (
-                                    resume_state.get("tweets_scraped", 0)
-                                    if resume_state
-                                    else 0
-                                )
-                            },
-                        )
-                        if action == "stop":
-                            return None, 0, 0
-                        retry += 1
-                    except Exception as e:
-                        resume_state = self.state_manager.load_state()
-                        action = self._wait_for_user_action(
-                            "unknown",
-                            str(e),
-                            {
-                                "tweets_scraped": (
-                                    resume_state.get("tweets_scraped", 0)
-                                    if resume_state
-                                    else 0
-                                )
-                            },
-                        )
-                        if action == "stop":
-                            return None, 0, 0
-                        retry += 1
-                return None, 0, 0
-
-            self.task = loop.create_task(links_task())
-            out, cnt, failed = loop.run_until_complete(self.task)
+            if not self._preflight_paths(save_dir, path):
+                return
+            # Parse the links file once; retries reuse the list
+            links = await asyncio.get_running_loop().run_in_executor(
+                None, load_links_file, path
+            )
+            out, cnt, failed = await links_task()
             if out:
                 self.links_log(f"✓ Done! {cnt} scraped, {failed} failed")
-                messagebox.showinfo("Complete", f"Scraped {cnt} tweets!")
+                self._show_message_async(
+                    messagebox.showinfo, "Complete", f"Scraped {cnt} tweets!"
+                )
         except asyncio.CancelledError:
             self.links_log("Cancelled")
         except Exception as e:
@@ -3205,27 +3645,23 @@ class TweetScraperApp:
             messagebox.showerror("Missing", "Enter start and end dates.")
             return
 
-        try:
-            st = self.start_time_entry.get().strip()
-            et = self.end_time_entry.get().strip()
-            if st == "00:00:00" or not st:
-                st = "00:00:00"
-            if et == "23:59:59" or not et:
-                et = "23:59:59"
-
-            start_dt = datetime.strptime(f"{start} {st}", "%Y-%m-%d %H:%M:%S")
-            end_dt = datetime.strptime(f"{end} {et}", "%Y-%m-%d %H:%M:%S")
-
-            if start_dt >= end_dt:
-                messagebox.showerror("Invalid", "Start must be before end.")
-                return
+        st = self.start_time_entry.get().strip() or "00:00:00"
+        et = self.end_time_entry.get().strip() or "23:59:59"
+        start_dt = combine_date_time(start, st)
+        end_dt = combine_date_time(end, et)
+        if start_dt is None or end_dt is None:
+            messagebox.showerror(
+                "Invalid", "Dates must be YYYY-MM-DD and times HH:MM or HH:MM:SS."
+            )
+            return
 
-            start = start_dt.strftime("%Y-%m-%d_%H:%M:%S")
-            end = end_dt.strftime("%Y-%m-%d_%H:%M:%S")
-        except Exception as e:
-            messagebox.showerror("Invalid", f"Date format error: {e}")
+        if start_dt >= end_dt:
+            messagebox.showerror("Invalid", "Start must be before end.")
             return
 
+        start = start_dt.strftime("%Y-%m-%d_%H:%M:%S")
+        end = end_dt.strftime("%Y-%m-%d_%H:%M:%S")
+
         fmt = self.format_var.get().lower()
         save_dir = self.save_dir.get()
         break_settings = self.get_break_settings()
@@ -3234,16 +3670,8 @@ class TweetScraperApp:
             if not self.file_path:
                 messagebox.showwarning("Missing", "Select a username file.")
                 return
-            with open(self.file_path, encoding="utf-8") as f:
-                users = [
-                    u.strip()
-                    for u in f.read().replace("\n", ",").split(",")
-                    if u.strip()
-                ]
-            if not users:
-                messagebox.showwarning("Empty", "No usernames found.")
-                return
-            target = ("batch", users)
+            # The worker reads the file; see _load_batch_target
+            target = ("batch_file", self.file_path)
         else:
             mode = self.mode_var.get()
             if mode == "Username":
@@ -3264,11 +3692,11 @@ class TweetScraperApp:
         self.current_task_type = "main"
         self.scrape_button.config(state="disabled")
         self.stop_btn.config(state="normal")
-        self.progress.grid()
-        self.progress.start(30)
-        self.count_lbl.config(text="Starting...", fg=Colors.PRIMARY)
+        self._show_progress()
+        self.count_var.set("Starting...")
+        self.count_lbl.config(fg=Colors.PRIMARY)
         self.clear_logs()
-        self._stop_requested = False
+        self._stop_evt.clear()
         self._is_running = True
 
         # Check if using API or cookie-based scraping
@@ -3292,11 +3720,10 @@ class TweetScraperApp:
             ).start()
         else:
             self.log("🍪 Starting cookie-based scrape...")
-            threading.Thread(
-                target=self._run_scrape,
-                args=(target, start, end, fmt, save_dir, break_settings),
-                daemon=True,
-            ).start()
+            load_scraper()
+            self._submit(
+                self._run_scrape(target, start, end, fmt, save_dir, break_settings)
+            )
 
     def _run_api_scrape(self, scraper, target, start, end, fmt, save_dir, break_settings):
         """Run scraping using API provider instead of cookies."""
@@ -3305,58 +3732,113 @@ class TweetScraperApp:
             if isinstance(msg, str):
                 self.log(msg)
             else:
-                self.root.after(
-                    0,
-                    lambda: self.count_lbl.config(
-                        text=f"Scraped: {msg}", fg=Colors.SUCCESS
-                    ),
-                )
+                self._post_count(msg)
 
         try:
+            target = self._load_batch_target(target)
+            if target is None:
+                return
+
             # Determine max results (large number for API, it will paginate)
             max_results = 10000
             
             if target[0] == "batch":
                 users = target[1]
-                all_tweets = []
-                
-                for i, username in enumerate(users):
+                results = [None] * len(users)
+                total = 0
+
+                concurrency = API_BATCH_CONCURRENCY
+                if self.app_settings:
+                    concurrency = self.app_settings.api_batch_concurrency
+                workers = max(1, min(concurrency, len(users)))
+
+                # The client paces its own requests for a single caller, so
+                # each extra worker thread gets a client of its own; their
+                # usage is folded back into ``scraper`` afterwards
+                worker_clients = []
+                clients_lock = threading.Lock()
+                local = threading.local()
+                # A rate limit seen by any worker holds back all of them
+                resume_at = [0.0]
+
+                def get_client():
+                    client = getattr(local, "client", None)
+                    if client is None:
+                        if workers == 1:
+                            client = scraper
+                        else:
+                            client = get_scraper(
+                                scraper.provider_type, api_key=scraper.api_key
+                            )
+                            with clients_lock:
+                                worker_clients.append(client)
+                        local.client = client
+                    return client
+
+                def fetch_user(index, username):
                     if self._should_stop():
-                        progress_cb("🛑 Stop requested")
-                        break
-                    
-                    progress_cb(f"👤 User {i+1}/{len(users)}: @{username}")
-                    
+                        return None
+                    with clients_lock:
+                        wait = resume_at[0] - time_module.monotonic()
+                    if wait > 0:
+                        time_module.sleep(wait)
+                    progress_cb(f"👤 User {index+1}/{len(users)}: @{username}")
                     try:
-                        result = scraper.get_user_tweets(
+                        return get_client().get_user_tweets(
                             username=username,
                             start_date=start,
                             end_date=end,
                             max_results=max_results,
                             exclude_replies=True,
                             progress_callback=progress_cb,
-                            should_stop_callback=self._should_stop,
+                            should_stop_callback=self._stop_evt.is_set,
                         )
-                        
+                    except APIRateLimitError as e:
+                        progress_cb(f"⏳ Rate limit hit. Waiting {e.retry_after}s...")
+                        with clients_lock:
+                            resume_at[0] = max(
+                                resume_at[0], time_module.monotonic() + e.retry_after
+                            )
+                        time_module.sleep(e.retry_after)
+                        return None
+
+                with ThreadPoolExecutor(max_workers=workers) as pool:
+                    futures = {
+                        pool.submit(fetch_user, i, username): (i, username)
+                        for i, username in enumerate(users)
+                    }
+                    for future in as_completed(futures):
+                        i, username = futures[future]
+                        try:
+                            result = future.result()
+                        except APIAuthenticationError as e:
+                            progress_cb(f"🔑 Auth error: {e}")
+                            self.root.after(0, self._handle_api_auth_error)
+                            for pending in futures:
+                                pending.cancel()
+                            break
+                        except Exception as e:
+                            progress_cb(f"❌ Error: {e}")
+                            continue
+
+                        if result is None:
+                            continue
                         if result.success:
-                            all_tweets.extend(result.tweets)
+                            results[i] = result.tweets
+                            total += len(result.tweets)
                             progress_cb(f"✓ Got {len(result.tweets)} tweets for @{username}")
-                            progress_cb(len(all_tweets))
+                            progress_cb(total)
                         else:
                             progress_cb(f"⚠️ Error for @{username}: {result.error}")
-                            
-                    except APIAuthenticationError as e:
-                        progress_cb(f"🔑 Auth error: {e}")
-                        self._handle_api_auth_error()
-                        break
-                    except APIRateLimitError as e:
-                        progress_cb(f"⏳ Rate limit hit. Waiting {e.retry_after}s...")
-                        import time
-                        time.sleep(e.retry_after)
-                        continue
-                    except Exception as e:
-                        progress_cb(f"❌ Error: {e}")
-                        continue
+
+                for client in worker_clients:
+                    scraper.add_usage(client.get_usage_stats())
+
+                if self._should_stop():
+                    progress_cb("🛑 Stop requested")
+
+                # Keep the output in the order the users were listed
+                all_tweets = [t for tweets in results if tweets for t in tweets]
                 
                 # Save all tweets
                 if all_tweets:
@@ -3364,7 +3846,8 @@ class TweetScraperApp:
                     progress_cb(f"✅ Saved {len(all_tweets)} tweets to {output_path}")
                     stats = scraper.get_usage_stats()
                     progress_cb(f"💰 Estimated cost: ${stats['estimated_cost']:.4f}")
-                    messagebox.showinfo(
+                    self._show_message_async(
+                        messagebox.showinfo,
                         "Complete",
                         f"Scraped {len(all_tweets)} tweets!\n\n"
                         f"API calls: {stats['total_api_calls']}\n"
@@ -3387,7 +3870,7 @@ class TweetScraperApp:
                         max_results=max_results,
                         exclude_replies=True,
                         progress_callback=progress_cb,
-                        should_stop_callback=self._should_stop,
+                        should_stop_callback=self._stop_evt.is_set,
                     )
                 else:
                     use_and = self.op_var.get() == "AND"
@@ -3400,7 +3883,7 @@ class TweetScraperApp:
                         use_and=use_and,
                         exclude_replies=True,
                         progress_callback=progress_cb,
-                        should_stop_callback=self._should_stop,
+                        should_stop_callback=self._stop_evt.is_set,
                     )
                 
                 if result.success and result.tweets:
@@ -3409,7 +3892,8 @@ class TweetScraperApp:
                     progress_cb(f"✅ Saved {len(result.tweets)} tweets")
                     stats = scraper.get_usage_stats()
                     progress_cb(f"💰 Estimated cost: ${stats['estimated_cost']:.4f}")
-                    messagebox.showinfo(
+                    self._show_message_async(
+                        messagebox.showinfo,
                         "Complete",
                         f"Scraped {len(result.tweets)} tweets!\n\n"
                         f"API calls: {stats['total_api_calls']}\n"
@@ -3418,29 +3902,36 @@ class TweetScraperApp:
                     )
                 elif result.error:
                     progress_cb(f"❌ Error: {result.error}")
-                    messagebox.showerror("Error", f"Scraping failed:\n{result.error}")
+                    self._show_message_async(
+                        messagebox.showerror, "Error", f"Scraping failed:\n{result.error}"
+                    )
                 else:
                     progress_cb("⚠️ No tweets found matching criteria")
-                    messagebox.showinfo("Complete", "No tweets found matching your criteria.")
+                    self._show_message_async(
+                        messagebox.showinfo, "Complete", "No tweets found matching your criteria."
+                    )
                     
         except APIAuthenticationError as e:
             self.log(f"🔑 Authentication failed: {e}")
-            self._handle_api_auth_error()
+            self.root.after(0, self._handle_api_auth_error)
         except APIRateLimitError as e:
             self.log(f"⏳ Rate limited: {e}")
-            messagebox.showwarning(
+            self._show_message_async(
+                messagebox.showwarning,
                 "Rate Limited",
                 f"API rate limit exceeded.\n\nPlease wait {e.retry_after // 60} minutes and try again."
             )
         except Exception as e:
             self.log(f"❌ Error: {e}")
-            messagebox.showerror("Error", f"An error occurred:\n{e}")
+            self._show_message_async(
+                messagebox.showerror, "Error", f"An error occurred:\n{e}"
+            )
         finally:
             self._cleanup_after_scrape()
 
     def _save_api_tweets(self, tweets, name, fmt, save_dir):
         """Save API-scraped tweets to file."""
-        import pandas as pd
+        import csv
         from datetime import datetime as dt
         
         # Ensure save directory exists
@@ -3453,26 +3944,71 @@ class TweetScraperApp:
         filename = f"{safe_name}_{timestamp}_api.{ext}"
         output_path = os.path.join(save_dir, filename)
         
-        # Convert tweets to dataframe
-        data = [tweet.to_dict() for tweet in tweets]
-        df = pd.DataFrame(data)
-        
-        # Reorder columns to match cookie-based output
-        column_order = [
+        # Same column order as the cookie-based output; to_row() matches it
+        headers = [
             "date", "username", "display_name", "text",
             "retweets", "likes", "replies", "quotes", "views",
             "tweet_id", "tweet_url"
         ]
-        df = df[[c for c in column_order if c in df.columns]]
+        rows = (tweet.to_row() for tweet in tweets)
         
-        # Save
+        # Stream rows straight to disk instead of building a DataFrame
         if fmt == "excel":
-            df.to_excel(output_path, index=False, engine="openpyxl")
+            from openpyxl import Workbook
+            
+            wb = Workbook(write_only=True)
+            ws = wb.create_sheet("Tweets")
+            ws.append(headers)
+            for row in rows:
+                ws.append(row)
+            wb.save(output_path)
         else:
-            df.to_csv(output_path, index=False, encoding="utf-8-sig")
+            with open(output_path, "w", newline="", encoding="utf-8-sig") as f:
+                writer = csv.writer(f)
+                writer.writerow(headers)
+                writer.writerows(rows)
         
         return output_path
 
+    def _preflight_paths(self, save_dir, input_path=None):
+        """Check scrape paths from the worker so slow disks never stall Tk."""
+        if input_path and not os.path.isfile(input_path):
+            self._show_message_async(
+                messagebox.showerror, "Missing", f"File not found:\n{input_path}"
+            )
+            return False
+        try:
+            os.makedirs(save_dir, exist_ok=True)
+        except OSError as e:
+            self._show_message_async(
+                messagebox.showerror, "Save Folder", f"Cannot use save folder:\n{e}"
+            )
+            return False
+        return True
+
+    def _load_batch_target(self, target):
+        """Read a batch username file in the worker; ``None`` if unusable."""
+        if target[0] != "batch_file":
+            return target
+        try:
+            text = Path(target[1]).read_text(encoding="utf-8")
+        except OSError as e:
+            self._show_message_async(
+                messagebox.showerror, "Username File", f"Cannot read file:\n{e}"
+            )
+            return None
+        users = [u for u in USERNAME_SPLIT_RE.split(text) if u]
+        if not users:
+            self._show_message_async(
+                messagebox.showwarning, "Empty", "No usernames found."
+            )
+            return None
+        return ("batch", users)
+
+    def _show_message_async(self, show, title, message):
+        """Queue a messagebox on the Tk thread without blocking the caller."""
+        self.root.after(0, show, title, message)
+
     def _handle_api_auth_error(self):
         """Handle API authentication errors."""
         result = messagebox.askyesno(
@@ -3491,6 +4027,10 @@ class TweetScraperApp:
         if not self.links_file_path:
             messagebox.showwarning("Missing", "Select a links file.")
             return
+        load_scraper()
+        if os.path.splitext(self.links_file_path)[1].lower() not in LINK_FILE_EXTENSIONS:
+            messagebox.showwarning("Unsupported", "Use a .txt or .xlsx/.xls file.")
+            return
 
         fmt = self.format_var.get().lower()
         save_dir = self.save_dir.get()
@@ -3498,59 +4038,69 @@ class TweetScraperApp:
 
         self.current_task_type = "links"
         self.links_scrape_btn.config(state="disabled")
-        self.progress.grid()
-        self.progress.start(30)
+        self._show_progress()
         self.links_log("Starting link scrape...")
-        self._stop_requested = False
+        self._stop_evt.clear()
         self._is_running = True
 
-        threading.Thread(
-            target=self._run_links,
-            args=(self.links_file_path, fmt, save_dir, break_settings),
-            daemon=True,
-        ).start()
+        self._submit(
+            self._run_links(self.links_file_path, fmt, save_dir, break_settings)
+        )
+
+    def _submit(self, coro):
+        """Schedule a scrape coroutine on the worker loop and track it."""
+        self.task = asyncio.run_coroutine_threadsafe(coro, self._aio_loop)
+        return self.task
 
     def stop_scrape(self):
         """FIX: Use explicit stop flag instead of just task.cancel()."""
-        self._stop_requested = True
+        self._stop_evt.set()
         self.log("🛑 Stop requested... (will stop after current operation)")
 
-        # Also cancel the task if it exists
+        # Cancel the task too so in-flight awaits raise CancelledError now
+        # rather than at the next stop check; the future returned by
+        # run_coroutine_threadsafe forwards the cancel to its loop
         if self.task and not self.task.done():
             self.task.cancel()
 
     def _cleanup_after_scrape(self):
         """Common cleanup after any scrape operation."""
-        self.progress.stop()
-        self.progress.grid_remove()
+        self.state_manager.flush_pending_state()
+        self._hide_progress()
         self.scrape_button.config(state="normal")
         self.stop_btn.config(state="disabled")
-        self.links_scrape_btn.config(state="normal")
-        self.count_lbl.config(text="Ready", fg=Colors.TEXT_SECONDARY)
+        if self._links_built:
+            self.links_scrape_btn.config(state="normal")
+        self._latest_count = self._shown_count = None
+        self.count_var.set("Ready")
+        self.count_lbl.config(fg=Colors.TEXT_SECONDARY)
         self.task = None
-        self.loop = None
-        self._stop_requested = False
+        self._stop_evt.clear()
         self._is_running = False
         self.current_scrape_state = {}
 
     def show_guide(self):
+        # The guide is built once and hidden on close; rebuild it only if it
+        # was destroyed or the colour theme changed since
+        guide = self._guide_window
+        if guide is not None and guide.winfo_exists():
+            if self._guide_dark == Colors.is_dark_mode():
+                guide.deiconify()
+                guide.lift()
+                return
+            guide.destroy()
+
         guide = tk.Toplevel(self.root)
+        # Build while unmapped so the text setup doesn't trigger reflows
+        guide.withdraw()
         guide.title("Chi Tweet Scraper - User Guide")
-        guide.geometry("680x650")
+        guide.protocol("WM_DELETE_WINDOW", guide.withdraw)
         guide.configure(bg=Colors.BG)
         guide.resizable(True, True)
 
-        try:
-            icon_path = resource_path(os.path.join("assets", "logo.ico"))
-            if os.path.exists(icon_path):
-                guide.iconbitmap(icon_path)
-        except:
-            pass
+        self._set_window_icon(guide)
 
-        guide.update_idletasks()
-        x = (guide.winfo_screenwidth() // 2) - 340
-        y = (guide.winfo_screenheight() // 2) - 325
-        guide.geometry(f"680x650+{x}+{y}")
+        center_window(guide, 680, 650)
 
         main = tk.Frame(guide, bg=Colors.BG, padx=20, pady=15)
         main.pack(fill="both", expand=True)
@@ -3561,70 +4111,15 @@ class TweetScraperApp:
         tk.Label(
             header,
             text="📖 Chi Tweet Scraper - User Guide",
-            font=("Segoe UI", 14, "bold"),
+            font=self._font_title,
             bg=Colors.PRIMARY,
             fg="white",
         ).pack(pady=12)
 
-        help_text = """🎯 QUICK START
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-1. Choose method: 🍪 Cookie (Free) or 🔑 API (Paid)
-2. Click 🍪 or ⚙ to configure authentication
-3. Enter username OR keywords
-4. Set date range (use presets for quick selection)
-5. Click "Start Scraping"
-
-
-🔐 AUTHENTICATION
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-COOKIES (Free):
-• Install "Cookie-Editor" browser extension
-• Go to Twitter → Export cookies as JSON
-• Click 🍪 → Paste → Save
-
-API (Paid ~$0.14/1k tweets):
-• Click ⚙ → Get API Key link
-• Sign up at twexapi.io
-• Paste key → Test → Save
-
-
-⚠️ ANTIVIRUS WARNING
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-App may be flagged - this is a FALSE POSITIVE!
-
-Windows Defender fix:
-1. Windows Security → Virus protection
-2. Manage settings → Exclusions
-3. Add exclusion → Folder → Select app folder
-
-📥 Download full documentation for detailed instructions.
-
-
-📊 EXPORT FORMATS
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Excel, CSV, JSON, SQLite, HTML, Markdown
-
-
-🆘 COMMON ISSUES
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-• Cookie expired → Get fresh cookies
-• Rate limit → Wait 15 min or enable breaks
-• No tweets → Check username/date range
-
-
-📞 NEED HELP? CONTACT US
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Use the buttons below to reach out!
-
-━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━━
-Made with ❤️ by OJ | v1.2.0 | Jan 2026
-"""
-
         text_frame = tk.Frame(main, bg=Colors.BG)
         text_frame.pack(fill="both", expand=True)
 
         scrollbar = ttk.Scrollbar(text_frame)
-        scrollbar.pack(side="right", fill="y")
 
         text = tk.Text(
             text_frame,
@@ -3632,81 +4127,51 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
             bg=Colors.BG_SECONDARY,
             fg=Colors.TEXT,  # Added text color
             relief="flat",
-            wrap=tk.WORD,
+            wrap="none",
             padx=15,
             pady=10,
             yscrollcommand=scrollbar.set,
             insertbackground=Colors.TEXT,  # Cursor color
+            undo=False,
+            maxundo=0,
+            exportselection=False,
+            state="disabled",
         )
-        text.pack(side="left", fill="both", expand=True)
         scrollbar.config(command=text.yview)
 
-        text.insert("1.0", help_text)
-        text.config(state="disabled")
+        # Read-only from the start; writable only for the one insert, and
+        # word wrap is switched on afterwards so it is laid out just once
+        text.config(state="normal")
+        text.insert("1.0", load_guide_text())
+        text.config(state="disabled", wrap=tk.WORD)
+        # Pack only once the content is in place; the scrollbar
+        # goes first so it keeps its width when the window is narrowed
+        scrollbar.pack(side="right", fill="y")
+        text.pack(side="left", fill="both", expand=True)
 
         # Row 1: Documentation & Video buttons
         btn_frame = tk.Frame(main, bg=Colors.BG)
         btn_frame.pack(fill="x", pady=(15, 5))
 
-        # PDF Download button
-        tk.Button(
-            btn_frame,
-            text="📥 Download Full Docs",
-            command=self._download_documentation,
-            bg=Colors.SUCCESS,
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=12,
-            pady=6,
-            activebackground="#16a34a",
-            activeforeground="white",
-        ).pack(side="left", padx=(0, 8))
-
-        tk.Button(
-            btn_frame,
-            text="📹 Setup Video",
-            command=lambda: webbrowser.open("https://youtu.be/RKX2sgQVgBg"),
-            bg=Colors.PRIMARY,
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=12,
-            pady=6,
-            activebackground=Colors.PRIMARY_DARK,
-            activeforeground="white",
-        ).pack(side="left", padx=(0, 8))
-
-        tk.Button(
-            btn_frame,
-            text="📹 Full Tutorial",
-            command=lambda: webbrowser.open("https://youtu.be/AbdpX6QZLm4"),
-            bg=Colors.PRIMARY,
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=12,
-            pady=6,
-            activebackground=Colors.PRIMARY_DARK,
-            activeforeground="white",
-        ).pack(side="left")
+        # PDF download and video links: (label, command or URL, ttk style)
+        for label, target, style in (
+            ("📥 Download Full Docs", self._download_documentation, "Success.TButton"),
+            ("📹 Setup Video", SETUP_VIDEO_URL, "Primary.TButton"),
+            ("📹 Full Tutorial", TUTORIAL_VIDEO_URL, "Primary.TButton"),
+        ):
+            ttk.Button(
+                btn_frame,
+                text=label,
+                command=target if callable(target) else partial(open_url, target),
+                style=style,
+                cursor="hand2",
+            ).pack(side="left", padx=(0, 8))
 
-        tk.Button(
+        ttk.Button(
             btn_frame,
             text="Close",
-            command=guide.destroy,
-            bg=Colors.BG_SECONDARY,
-            fg=Colors.TEXT,
-            font=("Segoe UI", 9),
-            relief="flat",
+            command=guide.withdraw,
             cursor="hand2",
-            padx=12,
-            pady=6,
-            activebackground=Colors.BORDER,
-            activeforeground=Colors.TEXT,
         ).pack(side="right")
         
         # Row 2: Contact/Social links
@@ -3716,58 +4181,30 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
         tk.Label(
             contact_frame,
             text="📞 Contact & Support:",
-            font=("Segoe UI", 9),
+            font=self._font_ui,
             bg=Colors.BG,
             fg=Colors.TEXT_SECONDARY,
         ).pack(side="left", padx=(0, 10))
         
-        # WhatsApp button
-        tk.Button(
-            contact_frame,
-            text="💬 WhatsApp",
-            command=lambda: webbrowser.open("https://wa.me/2348088666352"),
-            bg="#25D366",  # WhatsApp green
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=10,
-            pady=4,
-            activebackground="#128C7E",
-            activeforeground="white",
-        ).pack(side="left", padx=(0, 6))
-        
-        # Twitter button
-        tk.Button(
-            contact_frame,
-            text="🐦 Twitter",
-            command=lambda: webbrowser.open("https://twitter.com/datacreatorhub"),
-            bg="#1DA1F2",  # Twitter blue
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=10,
-            pady=4,
-            activebackground="#0c85d0",
-            activeforeground="white",
-        ).pack(side="left", padx=(0, 6))
-        
-        # GitHub button
-        tk.Button(
-            contact_frame,
-            text="🐙 GitHub",
-            command=lambda: webbrowser.open("https://github.com/OJTheCreator"),
-            bg="#333333",  # GitHub dark
-            fg="white",
-            font=("Segoe UI", 9),
-            relief="flat",
-            cursor="hand2",
-            padx=10,
-            pady=4,
-            activebackground="#24292e",
-            activeforeground="white",
-        ).pack(side="left")
+        for label, url, bg, active_bg in CONTACT_LINKS:
+            tk.Button(
+                contact_frame,
+                text=label,
+                command=partial(open_url, url),
+                bg=bg,
+                fg="white",
+                font=self._font_ui,
+                relief="flat",
+                cursor="hand2",
+                padx=10,
+                pady=4,
+                activebackground=active_bg,
+                activeforeground="white",
+            ).pack(side="left", padx=(0, 6))
+
+        self._guide_window = guide
+        self._guide_dark = Colors.is_dark_mode()
+        guide.deiconify()
 
     def _toggle_dark_mode(self):
         """Toggle dark mode and apply immediately."""
@@ -3790,11 +4227,14 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
             self.app_settings.dark_mode = is_dark
             save_app_settings(self.app_settings)
         
-        # Apply theme to entire app
-        self._apply_theme()
+        # Repaint the whole app once Tk is idle
+        if not self._theme_pending:
+            self._theme_pending = True
+            self.root.after_idle(self._apply_theme)
     
     def _apply_theme(self):
         """Apply current theme colors to all widgets."""
+        self._theme_pending = False
         # Update root window
         self.root.configure(bg=Colors.BG)
         
@@ -3826,21 +4266,6 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                 selectbackground=Colors.PRIMARY,
                 selectforeground="white",
             )
-        
-        # Update notebook tabs
-        if hasattr(self, 'notebook'):
-            style = ttk.Style()
-            style.configure("TNotebook", background=Colors.BG)
-            style.configure(
-                "TNotebook.Tab",
-                background=Colors.BG_SECONDARY,
-                foreground=Colors.TEXT_SECONDARY,
-            )
-            style.map(
-                "TNotebook.Tab",
-                background=[("selected", Colors.BG)],
-                foreground=[("selected", Colors.PRIMARY)],
-            )
     
     def _update_widget_colors(self, widget):
         """Recursively update widget colors for theme change."""
@@ -3852,11 +4277,11 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                 try:
                     current_bg = widget.cget('bg')
                     # Keep primary-colored frames (like logo background)
-                    if current_bg in ('#2563eb', '#3b82f6', '#1d4ed8'):
+                    if current_bg in PRIMARY_SHADES:
                         widget.configure(bg=Colors.PRIMARY)
                     else:
                         widget.configure(bg=Colors.BG)
-                except:
+                except tk.TclError:
                     widget.configure(bg=Colors.BG)
                     
             elif widget_class == 'Label':
@@ -3864,13 +4289,13 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                     current_bg = widget.cget('bg')
                     current_fg = widget.cget('fg')
                     # Keep labels with white text on colored backgrounds
-                    if current_fg == 'white' or current_bg in ('#2563eb', '#3b82f6', '#1d4ed8'):
+                    if current_fg == 'white' or current_bg in PRIMARY_SHADES:
                         widget.configure(bg=Colors.PRIMARY, fg='white')
-                    elif current_fg in ('#64748b', '#a1a1b5'):  # Secondary text
+                    elif current_fg in SECONDARY_TEXT_SHADES:  # Secondary text
                         widget.configure(bg=Colors.BG, fg=Colors.TEXT_SECONDARY)
                     else:
                         widget.configure(bg=Colors.BG, fg=Colors.TEXT)
-                except:
+                except tk.TclError:
                     pass
                     
             elif widget_class == 'Button':
@@ -3879,14 +4304,14 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                     current_fg = widget.cget('fg')
                     
                     # Primary buttons (blue)
-                    if current_bg in ('#2563eb', '#1d4ed8', '#3b82f6') or current_fg == 'white':
-                        if current_bg in ('#22c55e', '#4ade80', '#16a34a'):  # Green/success
+                    if current_bg in PRIMARY_SHADES or current_fg == 'white':
+                        if current_bg in SUCCESS_SHADES:  # Green/success
                             widget.configure(
                                 bg=Colors.SUCCESS,
                                 activebackground="#16a34a",
                                 activeforeground="white",
                             )
-                        elif current_bg in ('#ef4444', '#f87171', '#dc2626'):  # Red/error
+                        elif current_bg in ERROR_SHADES:  # Red/error
                             widget.configure(
                                 bg=Colors.ERROR,
                                 activebackground="#dc2626",
@@ -3906,7 +4331,7 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                             activebackground=Colors.BORDER,
                             activeforeground=Colors.TEXT,
                         )
-                except:
+                except tk.TclError:
                     pass
                     
             elif widget_class == 'Text':
@@ -3918,7 +4343,7 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                         selectbackground=Colors.PRIMARY,
                         selectforeground="white",
                     )
-                except:
+                except tk.TclError:
                     pass
                     
             elif widget_class == 'Entry':
@@ -3932,7 +4357,7 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                         disabledbackground=Colors.BG_SECONDARY,
                         disabledforeground=Colors.TEXT_SECONDARY,
                     )
-                except:
+                except tk.TclError:
                     pass
                     
             elif widget_class == 'Listbox':
@@ -3945,13 +4370,17 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
                         highlightbackground=Colors.BORDER,
                         highlightcolor=Colors.PRIMARY,
                     )
-                except:
+                except tk.TclError:
                     pass
                     
             elif widget_class == 'Canvas':
                 try:
-                    widget.configure(bg=Colors.BG)
-                except:
+                    # Keep primary-colored canvases (like the logo)
+                    if widget.cget('bg') in PRIMARY_SHADES:
+                        widget.configure(bg=Colors.PRIMARY)
+                    else:
+                        widget.configure(bg=Colors.BG)
+                except tk.TclError:
                     pass
                     
         except Exception:
@@ -3961,7 +4390,7 @@ Made with ❤️ by OJ | v1.2.0 | Jan 2026
         try:
             for child in widget.winfo_children():
                 self._update_widget_colors(child)
-        except:
+        except tk.TclError:
             pass
 
     def _download_documentation(self):
@@ -4812,7 +5241,7 @@ Made with ❤️ by OJ | January 2026"""),
             try:
                 self._create_pdf_documentation(filepath, doc_sections)
                 messagebox.showinfo("Success", f"PDF Documentation saved to:\n{filepath}")
-                webbrowser.open(filepath)
+                open_url(filepath)
                 return
             except ImportError:
                 # Fallback to text if reportlab not installed
@@ -4828,19 +5257,15 @@ Made with ❤️ by OJ | January 2026"""),
         
         # Create text file
         try:
+            # Compose the whole file first and write it in one call
+            parts = [DOC_TEXT_HEADER]
+            for title, content in doc_sections[1:]:  # Skip the header
+                parts.append(f"\n{title}\n{'-' * len(title)}\n{content}\n\n")
             with open(filepath, 'w', encoding='utf-8') as f:
-                f.write("=" * 70 + "\n")
-                f.write("CHI TWEET SCRAPER - COMPLETE USER DOCUMENTATION\n")
-                f.write("Version 1.2.0\n")
-                f.write("=" * 70 + "\n\n")
-                
-                for title, content in doc_sections[1:]:  # Skip the header
-                    f.write(f"\n{title}\n")
-                    f.write("-" * len(title) + "\n")
-                    f.write(content + "\n\n")
+                f.write("".join(parts))
             
             messagebox.showinfo("Success", f"Documentation saved to:\n{filepath}")
-            webbrowser.open(filepath)
+            open_url(filepath)
         except Exception as e:
             messagebox.showerror("Error", f"Failed to save documentation:\n{str(e)}")
 
@@ -4922,10 +5347,10 @@ Made with ❤️ by OJ | January 2026"""),
 
 
 if __name__ == "__main__":
-    cookies_dir = resource_path("cookies")
-    exports_dir = resource_path(os.path.join("data", "exports"))
-    os.makedirs(cookies_dir, exist_ok=True)
-    os.makedirs(exports_dir, exist_ok=True)
+    # A stat is enough on warm starts; only create what is missing
+    for directory in (COOKIES_DIR, EXPORTS_DIR):
+        if not os.path.isdir(directory):
+            os.makedirs(directory, exist_ok=True)
 
     root = tk.Tk()
     app = TweetScraperApp(root)
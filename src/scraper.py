@@ -36,6 +36,8 @@ EMPTY_PAGE_PROMPT_THRESHOLD = 25
 MAX_CURSOR_REFRESHES = 10
 MAX_CONSECUTIVE_ERRORS = 20
 AUTO_SAVE_INTERVAL = 25
+EXCEL_LINK_EXTENSIONS = frozenset({".xlsx", ".xls"})
+LINK_FILE_EXTENSIONS = EXCEL_LINK_EXTENSIONS | {".txt"}
 
 BASE_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
 COOKIES_FILE = os.path.join(BASE_DIR, "cookies", "twikit_cookies.json")
@@ -1464,6 +1466,28 @@ async def scrape_tweets(
 # ========================================
 # LINK SCRAPING
 # ========================================
+def load_links_file(file_path: str) -> list:
+    """Read tweet links from the first column of a spreadsheet or a text file."""
+    ext = os.path.splitext(file_path)[1].lower()
+    if ext == ".xlsx":
+        # Read-only mode streams rows instead of building the whole workbook
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = wb.active.iter_rows(min_col=1, max_col=1, values_only=True)
+            links = [str(row[0]).strip() for row in rows if row[0] is not None]
+        finally:
+            wb.close()
+    elif ext in EXCEL_LINK_EXTENSIONS:
+        df = pd.read_excel(file_path, header=None)
+        links = [l.strip() for l in df.iloc[:, 0].dropna().astype(str)]
+    elif ext == ".txt":
+        with open(file_path, "rb") as f:
+            links = [l.strip() for l in f.read().decode("utf-8", "ignore").splitlines()]
+    else:
+        raise TwitterScraperError("Use .txt or .xlsx/.xls")
+    return [l for l in links if l]
+
+
 async def scrape_tweet_links_file(
     file_path,
     export_format="excel",
@@ -1474,8 +1498,13 @@ async def scrape_tweet_links_file(
     network_error_callback=None,
     break_settings=None,
     resume_state=None,
+    links=None,
 ):
-    """Scrape tweets from a file of links."""
+    """Scrape tweets from a file of links.
+
+    ``links`` may carry the file's contents already parsed by
+    load_links_file, so retries don't re-read the file.
+    """
     csv_file = None
     wb = None
     ws = None
@@ -1537,16 +1566,8 @@ async def scrape_tweet_links_file(
                 ws.title = "Tweets"
                 ws.append(headers)
 
-        # Load links
-        ext = os.path.splitext(file_path)[1].lower()
-        if ext in [".xlsx", ".xls"]:
-            df = pd.read_excel(file_path, header=None)
-            links = df.iloc[:, 0].dropna().astype(str).tolist()
-        elif ext == ".txt":
-            with open(file_path, "r", encoding="utf-8") as f:
-                links = [l.strip() for l in f if l.strip()]
-        else:
-            raise TwitterScraperError("Use .txt or .xlsx/.xls")
+        if links is None:
+            links = load_links_file(file_path)
 
         valid_links = [
             l for l in links if TWEET_ID_PATTERN.match(l) and l not in processed_links
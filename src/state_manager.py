@@ -1,5 +1,9 @@
 import json
 import os
+from array import array
+import shutil
+import tempfile
+import threading
 from datetime import datetime
 from typing import Optional, Dict, Any, List
 import logging
@@ -8,6 +12,9 @@ logger = logging.getLogger(__name__)
 
 STATE_FILE = os.path.join(os.path.dirname(__file__), "..", "data", "scraper_state.json")
 
+# save_state_debounced writes at most once per this many seconds
+SAVE_DEBOUNCE_SECS = 5.0
+
 
 class StateManager:
     """Manages scraping session state for resumable operations."""
@@ -20,8 +27,23 @@ class StateManager:
             state_file: Optional custom path for state file (useful for testing)
         """
         self.state_file = state_file or STATE_FILE
+        self.journal_file = self.state_file + ".journal"
+        self.seen_ids_file = self.state_file + ".seen.bin"
         self.state_dir = os.path.dirname(self.state_file)
-        os.makedirs(self.state_dir, exist_ok=True)
+        if not os.path.isdir(self.state_dir):
+            os.makedirs(self.state_dir, exist_ok=True)
+
+        # Latest state waiting for the debounce timer, and the clear_state
+        # generation it was queued in
+        self._pending_state = None
+        self._pending_generation = 0
+        self._save_timer = None
+        self._pending_lock = threading.Lock()
+        # Serialises every write to the state, journal and sidecar files.
+        # Re-entrant because journal_append flushes through save_state.
+        self._io_lock = threading.RLock()
+        # Bumped by clear_state so a save queued before it is never written
+        self._generation = 0
 
     def save_state(self, state_data: Dict[str, Any]) -> bool:
         """
@@ -40,12 +62,19 @@ class StateManager:
                 - links_file_path: Path to links file (if links mode)
                 - output_path: Current output file path
                 - seen_tweet_ids: Set/list of already scraped tweet IDs
+                - seen_tweet_ids_path: Sidecar file holding seen IDs instead
+                  (see append_seen_ids)
                 - processed_links: Set/list of already processed links
                 - keywords: List of keywords (if keyword mode)
 
         Returns:
             True if save successful, False otherwise
         """
+        with self._io_lock:
+            return self._save_state_locked(state_data)
+
+    def _save_state_locked(self, state_data: Dict[str, Any]) -> bool:
+        """Write ``state_data``; the caller holds ``_io_lock``."""
         try:
             # Add metadata
             state_data["timestamp"] = datetime.now().isoformat()
@@ -67,20 +96,37 @@ class StateManager:
                 logger.error("Cannot save state: 'mode' field is required")
                 return False
 
+            # Serialize up front so a bad value can't leave a partial file
+            data = json.dumps(state_data, ensure_ascii=False, separators=(",", ":"))
+
             # Create backup of existing state before overwriting
             if os.path.exists(self.state_file):
-                backup_file = self.state_file + ".backup"
                 try:
-                    with open(self.state_file, "r", encoding="utf-8") as f:
-                        backup_data = f.read()
-                    with open(backup_file, "w", encoding="utf-8") as f:
-                        f.write(backup_data)
+                    shutil.copyfile(self.state_file, self.state_file + ".backup")
                 except Exception as e:
                     logger.warning(f"Failed to create state backup: {e}")
 
-            # Write new state
-            with open(self.state_file, "w", encoding="utf-8") as f:
-                json.dump(state_data, f, indent=2, ensure_ascii=False)
+            # Write to a temp file of our own and swap it in; a failed or
+            # interrupted write leaves the previous state file untouched
+            fd, tmp_file = tempfile.mkstemp(
+                dir=self.state_dir,
+                prefix=os.path.basename(self.state_file) + ".",
+                suffix=".tmp",
+            )
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8", buffering=1 << 16) as f:
+                    f.write(data)
+                os.replace(tmp_file, self.state_file)
+            except BaseException:
+                try:
+                    os.remove(tmp_file)
+                except OSError:
+                    pass
+                raise
+
+            # The snapshot now includes everything journalled so far
+            if os.path.exists(self.journal_file):
+                os.remove(self.journal_file)
 
             logger.info(
                 f"State saved successfully: {state_data.get('mode')} mode, "
@@ -90,19 +136,155 @@ class StateManager:
 
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
-            # Try to restore from backup if save failed
-            backup_file = self.state_file + ".backup"
-            if os.path.exists(backup_file):
-                try:
-                    with open(backup_file, "r", encoding="utf-8") as f:
-                        backup_data = f.read()
-                    with open(self.state_file, "w", encoding="utf-8") as f:
-                        f.write(backup_data)
-                    logger.info("Restored state from backup after save failure")
-                except:
-                    pass
             return False
 
+    def save_state_debounced(
+        self, state_data: Dict[str, Any], delay: float = SAVE_DEBOUNCE_SECS
+    ) -> None:
+        """
+        Save state within ``delay`` seconds, coalescing calls made meanwhile.
+
+        Only the most recent state is written. load_state, journal_append
+        and flush_pending_state write it out early; clear_state drops it.
+
+        Args:
+            state_data: Same structure as save_state
+            delay: Seconds to wait for further updates before writing
+        """
+        with self._pending_lock:
+            # Shallow copy so later in-place edits by the caller don't race
+            # with the write on the timer thread
+            self._pending_state = dict(state_data)
+            self._pending_generation = self._generation
+            if self._save_timer is None:
+                self._save_timer = threading.Timer(delay, self.flush_pending_state)
+                self._save_timer.daemon = True
+                self._save_timer.start()
+
+    def flush_pending_state(self) -> bool:
+        """
+        Write any state queued by save_state_debounced now.
+
+        Returns:
+            True if there was nothing to write or the write succeeded
+        """
+        # Take and write the pending state under the I/O lock, so a journal
+        # entry or clear_state can't land between the two
+        with self._io_lock:
+            with self._pending_lock:
+                state, self._pending_state = self._pending_state, None
+                generation = self._pending_generation
+                timer, self._save_timer = self._save_timer, None
+            if timer:
+                timer.cancel()
+            if state is None or generation != self._generation:
+                return True
+            return self._save_state_locked(state)
+
+    def journal_append(self, key: str, value: Any) -> bool:
+        """
+        Record a single field change without rewriting the whole state file.
+
+        Entries are replayed on top of the snapshot by load_state and
+        discarded by the next save_state.
+
+        Args:
+            key: State field name
+            value: New value for the field
+
+        Returns:
+            True if the entry was written, False otherwise
+        """
+        if isinstance(value, set):
+            value = list(value)
+
+        with self._io_lock:
+            # Journal entries apply on top of the latest snapshot
+            self.flush_pending_state()
+
+            try:
+                line = json.dumps({key: value}, ensure_ascii=False)
+                with open(self.journal_file, "a", encoding="utf-8") as f:
+                    f.write(line + "\n")
+                    f.flush()
+                    os.fsync(f.fileno())
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to append to state journal: {e}")
+                return False
+
+    def append_seen_ids(self, tweet_ids) -> bool:
+        """
+        Append tweet IDs to the seen-IDs sidecar file as packed uint64s.
+
+        Keeps large ID sets out of the JSON state so each save stays small;
+        numeric IDs take 8 bytes each instead of a quoted JSON string.
+
+        Args:
+            tweet_ids: Iterable of numeric tweet IDs not yet recorded
+
+        Returns:
+            True if the IDs were written, False otherwise
+        """
+        try:
+            packed = array("Q", map(int, tweet_ids))
+            if packed:
+                with self._io_lock, open(self.seen_ids_file, "ab") as f:
+                    packed.tofile(f)
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to record seen tweet IDs: {e}")
+            return False
+
+    def reset_seen_ids(self) -> None:
+        """Discard IDs recorded by append_seen_ids (start of a new batch)."""
+        try:
+            with self._io_lock:
+                os.remove(self.seen_ids_file)
+        except FileNotFoundError:
+            pass
+        except Exception as e:
+            logger.warning(f"Failed to reset seen tweet IDs: {e}")
+
+    def load_seen_ids(self) -> set:
+        """
+        Load the tweet IDs recorded by append_seen_ids.
+
+        Returns:
+            Set of tweet ID strings (empty if none were recorded)
+        """
+        try:
+            with open(self.seen_ids_file, "rb") as f:
+                data = f.read()
+        except FileNotFoundError:
+            return set()
+        except Exception as e:
+            logger.warning(f"Failed to load seen tweet IDs: {e}")
+            return set()
+
+        packed = array("Q")
+        # Ignore a torn trailing record from an interrupted append
+        packed.frombytes(data[: len(data) - len(data) % packed.itemsize])
+        return set(map(str, packed))
+
+    def _replay_journal(self, state: Dict[str, Any]) -> None:
+        """Apply journalled field changes to a loaded snapshot in order."""
+        if not os.path.exists(self.journal_file):
+            return
+
+        try:
+            with open(self.journal_file, "r", encoding="utf-8") as f:
+                for line in f:
+                    try:
+                        state.update(json.loads(line))
+                    except json.JSONDecodeError:
+                        # A torn final line from an interrupted write
+                        break
+        except Exception as e:
+            logger.warning(f"Failed to replay state journal: {e}")
+
     def load_state(self) -> Optional[Dict[str, Any]]:
         """
         Load saved state from file.
@@ -110,6 +292,8 @@ class StateManager:
         Returns:
             State dictionary or None if no state exists or is corrupted
         """
+        self.flush_pending_state()
+
         if not os.path.exists(self.state_file):
             return None
 
@@ -122,6 +306,8 @@ class StateManager:
                 logger.error("Invalid state: not a dictionary")
                 return None
 
+            self._replay_journal(state)
+
             if "mode" not in state:
                 logger.error("Invalid state: missing 'mode' field")
                 return None
@@ -170,25 +356,41 @@ class StateManager:
 
     def clear_state(self) -> bool:
         """
-        Delete the state file and its backup.
+        Delete the state file, its backup, journal and seen-IDs file.
 
         Returns:
             True if cleared successfully, False otherwise
         """
-        try:
-            files_to_remove = [self.state_file, self.state_file + ".backup"]
-
-            for file_path in files_to_remove:
-                if os.path.exists(file_path):
-                    os.remove(file_path)
-                    logger.debug(f"Removed {os.path.basename(file_path)}")
-
-            logger.info("State files cleared successfully")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to clear state: {e}")
-            return False
+        # Waits for an in-flight write; the generation bump stops any save
+        # queued before this call from recreating the files afterwards
+        with self._io_lock:
+            with self._pending_lock:
+                self._generation += 1
+                self._pending_state = None
+                timer, self._save_timer = self._save_timer, None
+            if timer:
+                timer.cancel()
+
+            try:
+                files_to_remove = [
+                    self.state_file,
+                    self.state_file + ".backup",
+                    self.state_file + ".tmp",
+                    self.journal_file,
+                    self.seen_ids_file,
+                ]
+
+                for file_path in files_to_remove:
+                    if os.path.exists(file_path):
+                        os.remove(file_path)
+                        logger.debug(f"Removed {os.path.basename(file_path)}")
+
+                logger.info("State files cleared successfully")
+                return True
+
+            except Exception as e:
+                logger.error(f"Failed to clear state: {e}")
+                return False
 
     def has_saved_state(self) -> bool:
         """
@@ -197,6 +399,9 @@ class StateManager:
         Returns:
             True if state file exists and is not empty
         """
+        if self._pending_state is not None:
+            return True
+
         if not os.path.exists(self.state_file):
             return False
 
@@ -943,6 +943,9 @@ class AppSettings:
     show_analytics_after_scrape: bool = True
     show_preview_before_save: bool = False
     google_sheets_enabled: bool = False
+    # Users fetched at once in API batch scrapes; raise only within the
+    # provider's rate limits
+    api_batch_concurrency: int = 1
 
 
 def get_app_settings_path():